@@ -9,6 +9,7 @@ This module contains:
 - Font configuration for matplotlib
 """
 
+import functools
 import locale
 import os
 import sys
@@ -24,6 +25,15 @@ import matplotlib.font_manager as fm
 # Resource Path Management
 # ============================================================================
 
+if getattr(sys, 'frozen', False):
+    # Running as compiled executable (PyInstaller)
+    _BASE_PATH = Path(sys.executable).parent
+else:
+    # Running as normal Python script - go up one level from esai/
+    _BASE_PATH = Path(__file__).parent.parent.resolve()
+
+
+@functools.lru_cache(maxsize=32)
 def get_resource_path(relative_path: str) -> str:
     """
     Get absolute path to resource files (images, icons, etc.).
@@ -39,26 +49,25 @@ def get_resource_path(relative_path: str) -> str:
     - Running from different working directories
     - Running as a script vs. frozen executable (PyInstaller, etc.)
     - Importing as a module
+    
+    Results are cached, so each resource is only looked up once per process.
     """
     try:
-        # Get the directory where this script is located
-        if getattr(sys, 'frozen', False):
-            # Running as compiled executable (PyInstaller)
-            base_path = Path(sys.executable).parent
-        else:
-            # Running as normal Python script - go up one level from esai/
-            base_path = Path(__file__).parent.parent.resolve()
+        # Directory where the application is located
+        base_path = _BASE_PATH
         
         # Construct absolute path to resource
         resource_path = base_path / relative_path
         
-        # Verify the file exists
-        if not resource_path.exists():
+        # Verify the file exists (a single stat call)
+        try:
+            os.stat(resource_path)
+        except OSError:
             raise FileNotFoundError(
                 f"Resource file not found: {resource_path}\n"
                 f"Looking in directory: {base_path}\n"
                 f"Please ensure the file exists in the application directory."
-            )
+            ) from None
         
         return str(resource_path)
         
@@ -298,6 +298,8 @@ Hover over any element to see tooltips with more information."""
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.right_frame)
         self.canvas.get_tk_widget().configure(bg=self.theme.colors.bg_card)
         self.canvas.get_tk_widget().pack(fill='both', expand=True, padx=5, pady=2)
+        
+        self.radar = RadarChartSimple(self.ax, self.colormap)
     
     def _create_bottom_panel(self):
         """Create the bottom panel with scores and buttons."""
@@ -609,11 +611,8 @@ Hover over any element to see tooltips with more information."""
             'Waste': self.waste_tab.get_dimension_score(weights['w8'])
         }
         
-        # Create radar chart (convert total from string to float)
-        radar = RadarChartSimple(self.ax, self.colormap)
-        radar.draw(colors, float(self.total_var.get()), dimension_scores)
-        
-        self.canvas.draw()
+        # Schedule radar chart redraw (convert total from string to float)
+        self.radar.request_draw(colors, float(self.total_var.get()), dimension_scores)
     
     def _export_pdf(self):
         """Export assessment report to PDF."""
@@ -631,7 +630,8 @@ Hover over any element to see tooltips with more information."""
             # Collect data
             weights = self.weight_tab.get_weights()
             
-            # Save radar chart image temporarily
+            # Save radar chart image temporarily (render any pending redraw first)
+            self.radar.flush()
             temp_radar = "temp_radar.png"
             self.fig.savefig(temp_radar, dpi=300, bbox_inches='tight')
             
@@ -8,17 +8,356 @@ This module contains:
 - Figure management for tkinter embedding
 """
 
+import functools
 from typing import Dict, List, Tuple, Optional
-import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 from matplotlib.figure import Figure
-from matplotlib.patches import Circle, Wedge, Polygon
-from matplotlib.colors import Normalize
+from matplotlib.patches import Circle
+from matplotlib.collections import PolyCollection
 import numpy as np
 import os
+import sys
 
 from esai.config import ColorConfig
 
+# Optional JIT compilation for batch rendering
+try:
+    from numba import njit
+except ImportError:
+    # Fallback to NumPy if numba not available
+    njit = None
+
+# Frozen builds (PyInstaller) ship no .py sources, which numba's cache needs
+if getattr(sys, 'frozen', False):
+    njit = None
+
+
+# ============================================================================
+# Static Chart Geometry
+# ============================================================================
+
+def _pack_vertices(vertices: Dict[int, List[Tuple[float, float]]]) -> np.ndarray:
+    """
+    Pack polygon vertex lists into one contiguous read-only array.
+    
+    All trapezoids have 4 vertices, so they fit an (N, 4, 2) float array
+    (ordered by principle ID) that PolyCollection takes without converting
+    each polygon separately.
+    """
+    packed = np.array([vertices[pid] for pid in sorted(vertices)], dtype=np.float64)
+    packed.flags.writeable = False
+    return packed
+
+
+# Trapezoid vertices for the 27 principles (RadarChart layout)
+_TRAPEZOID_ARRAY = _pack_vertices({
+    # Top trapezoids (SC: principles 1-4)
+    1: [(-2.7, 7), (-0.7, 7), (-0.7, 10), (-3.7, 10)],
+    2: [(-0.7, 7), (0.7, 7), (0.7, 10), (-0.7, 10)],
+    3: [(0.7, 7), (2.1, 7), (2.1, 10), (0.7, 10)],
+    4: [(2.1, 7), (2.7, 7), (3.7, 10), (2.1, 10)],
+
+    # Top-right trapezoids (SP: principles 5-10)
+    5: [(3.2, 6.8), (3.8, 6.2), (5.8, 8.2), (4.2, 9.8)],
+    6: [(3.8, 6.2), (5.8, 8.2), (6.3, 7.7), (4.3, 5.7)],
+    7: [(4.3, 5.7), (6.3, 7.7), (7.3, 6.7), (5.3, 4.7)],
+    8: [(5.3, 4.7), (7.3, 6.7), (8.3, 5.7), (6.3, 3.7)],
+    9: [(6.3, 3.7), (8.3, 5.7), (8.8, 5.2), (6.8, 3.2)],
+    10: [(6.8, 3.2), (8.8, 5.2), (9.8, 4.2), (6.8, 3.2)],
+
+    # Right trapezoids (AT: principles 11-16)
+    11: [(7, 1.8), (10, 1.8), (10, 3.7), (7, 2.7)],
+    12: [(7, 1.8), (10, 1.8), (10, 1.2), (7, 1.2)],
+    13: [(7, 1.2), (10, 1.2), (10, 0), (7, 0)],
+    14: [(7, 0), (10, 0), (10, -1.2), (7, -1.2)],
+    15: [(7, -1.2), (10, -1.2), (10, -1.8), (7, -1.8)],
+    16: [(7, -1.8), (10, -1.8), (10, -3.7), (7, -2.7)],
+
+    # Bottom-right trapezoid (Economy: principle 17)
+    17: [(3.2, -6.8), (4.2, -9.8), (9.8, -4.2), (6.8, -3.2)],
+
+    # Bottom trapezoids (Method: principles 18-19)
+    18: [(2.7, -7), (3.7, -10), (0, -10), (0, -7)],
+    19: [(-2.7, -7), (-3.7, -10), (0, -10), (0, -7)],
+
+    # Bottom-left trapezoid (Operator: principle 20)
+    20: [(-3.2, -6.8), (-4.2, -9.8), (-9.8, -4.2), (-6.8, -3.2)],
+
+    # Left trapezoids (Reagent: principles 21-25)
+    21: [(-7, -2.7), (-10, -3.7), (-10, -1.6), (-7, -1.6)],
+    22: [(-7, -1.6), (-10, -1.6), (-10, -0.8), (-7, -0.8)],
+    23: [(-7, -0.8), (-10, -0.8), (-10, 0), (-7, 0)],
+    24: [(-7, 0), (-10, 0), (-10, 1.6), (-7, 1.6)],
+    25: [(-7, 1.6), (-10, 1.6), (-10, 3.7), (-7, 2.7)],
+
+    # Top-left trapezoids (Waste: principles 26-27)
+    26: [(-5, 5), (-7, 7), (-9.8, 4.2), (-6.8, 3.2)],
+    27: [(-3.2, 6.8), (-4.2, 9.8), (-7, 7), (-5, 5)]
+})
+
+# Trapezoid vertices for the 27 principles (RadarChartSimple layout, fixed vertex order)
+_SIMPLE_TRAPEZOID_ARRAY = _pack_vertices({
+    # Top trapezoids (SC: principles 1-4)
+    1: [(-2.7, 7), (-0.7, 7), (-0.7, 10), (-3.7, 10)],
+    2: [(-0.7, 7), (0.7, 7), (0.7, 10), (-0.7, 10)],
+    3: [(0.7, 7), (2.1, 7), (2.1, 10), (0.7, 10)],
+    4: [(2.1, 7), (2.7, 7), (3.7, 10), (2.1, 10)],
+
+    # Top-right trapezoids (SP: principles 5-10)
+    5: [(3.2, 6.8), (3.8, 6.2), (5.8, 8.2), (4.2, 9.8)],
+    6: [(3.8, 6.2), (4.3, 5.7), (6.3, 7.7), (5.8, 8.2)],
+    7: [(4.3, 5.7), (5.3, 4.7), (7.3, 6.7), (6.3, 7.7)],
+    8: [(5.3, 4.7), (6.3, 3.7), (8.3, 5.7), (7.3, 6.7)],
+    9: [(6.3, 3.7), (6.8, 3.2), (8.8, 5.2), (8.3, 5.7)],
+    10: [(6.8, 3.2), (9.8, 4.2), (8.8, 5.2), (6.8, 3.2)],
+
+    # Right trapezoids (AT: principles 11-16) - fixed vertex order
+    11: [(7, 2.7), (10, 3.7), (10, 1.8), (7, 1.8)],
+    12: [(7, 1.8), (10, 1.8), (10, 1.2), (7, 1.2)],
+    13: [(7, 1.2), (10, 1.2), (10, 0), (7, 0)],
+    14: [(7, 0), (10, 0), (10, -1.2), (7, -1.2)],
+    15: [(7, -1.2), (10, -1.2), (10, -1.8), (7, -1.8)],
+    16: [(7, -1.8), (10, -1.8), (10, -3.7), (7, -2.7)],
+
+    # Bottom-right trapezoid (Economy: principle 17)
+    17: [(3.2, -6.8), (4.2, -9.8), (9.8, -4.2), (6.8, -3.2)],
+
+    # Bottom trapezoids (Method: principles 18-19)
+    18: [(0, -7), (0, -10), (3.7, -10), (2.7, -7)],
+    19: [(0, -7), (0, -10), (-3.7, -10), (-2.7, -7)],
+
+    # Bottom-left trapezoid (Operator: principle 20)
+    20: [(-3.2, -6.8), (-6.8, -3.2), (-9.8, -4.2), (-4.2, -9.8)],
+
+    # Left trapezoids (Reagent: principles 21-25)
+    21: [(-7, -1.6), (-10, -1.6), (-10, -3.7), (-7, -2.7)],
+    22: [(-7, -0.8), (-10, -0.8), (-10, -1.6), (-7, -1.6)],
+    23: [(-7, 0), (-10, 0), (-10, -0.8), (-7, -0.8)],
+    24: [(-7, 1.6), (-10, 1.6), (-10, 0), (-7, 0)],
+    25: [(-7, 2.7), (-10, 3.7), (-10, 1.6), (-7, 1.6)],
+
+    # Top-left trapezoids (Waste: principles 26-27)
+    26: [(-5, 5), (-6.8, 3.2), (-9.8, 4.2), (-7, 7)],
+    27: [(-3.2, 6.8), (-5, 5), (-7, 7), (-4.2, 9.8)]
+})
+
+# Outline frames for dimension groups
+_OUTLINE_POLYS = np.array([
+    [(-2.7, 7), (-3.7, 10), (3.7, 10), (2.7, 7)],            # Top frame (SC)
+    [(3.2, 6.8), (4.2, 9.8), (9.8, 4.2), (6.8, 3.2)],        # Right-top frame (SP)
+    [(7, -2.7), (10, -3.7), (10, 3.7), (7, 2.7)],            # Right frame (AT)
+    [(-2.7, -7), (-3.7, -10), (3.7, -10), (2.7, -7)],        # Bottom frame (Method)
+    [(-3.2, 6.8), (-4.2, 9.8), (-9.8, 4.2), (-6.8, 3.2)],    # Left-top frame (Waste)
+    [(-7, -2.7), (-10, -3.7), (-10, 3.7), (-7, 2.7)],        # Left frame (Reagent)
+], dtype=np.float64)
+_OUTLINE_POLYS.flags.writeable = False
+
+# Text label positions for each principle number
+_PRINCIPLE_LABEL_POSITIONS: Dict[int, Tuple[float, float]] = {
+    1: (-2, 8.5), 2: (0, 8.5), 3: (1.4, 8.5), 4: (2.7, 8.5),
+    5: (4.5, 7.8), 6: (5.1, 7), 7: (5.8, 6.2), 8: (6.8, 5.2),
+    9: (7.6, 4.5), 10: (8.3, 4.0),
+    11: (8.5, 2.5), 12: (8.5, 1.4), 13: (8.5, 0.4),
+    14: (8.5, -0.8), 15: (8.5, -1.6), 16: (8.5, -2.5),
+    17: (6.1, -5.9),
+    18: (1.5, -8.5), 19: (-1.5, -8.5),
+    20: (-6.1, -5.9),
+    21: (-8.5, -2.2), 22: (-8.5, -1.3), 23: (-8.5, -0.5),
+    24: (-8.5, 0.8), 25: (-8.5, 2.2),
+    26: (-7, 5), 27: (-5, 7)
+}
+
+# Positions for the dimension letters (outer ring)
+_DIMENSION_LABEL_POSITIONS: Dict[str, Tuple[float, float]] = {
+    'C': (0, 6), 'P': (4.2, 4.3), 'A': (6, 0),
+    'E': (4.2, -4.3), 'M': (0, -6), 'O': (-4.2, -4.3),
+    'R': (-6, 0), 'W': (-4.2, 4.3)
+}
+
+# Positions for the dimension score displays (inner sectors)
+_SCORE_POSITIONS: Dict[str, Tuple[float, float]] = {
+    'SC': (0, 3.5), 'SP': (2.7, 2.6), 'AT': (3.5, 0),
+    'Economy': (2.7, -2.6), 'Method': (0, -3.5),
+    'Operator': (-2.7, -2.6), 'Reagent': (-3.5, 0),
+    'Waste': (-2.7, 2.6)
+}
+
+# Dimension drawn in each sector, counter-clockwise from 22.5 degrees
+_SECTOR_ORDER: Tuple[str, ...] = ('SP', 'SC', 'Waste', 'Reagent', 'Operator', 'Method', 'Economy', 'AT')
+
+# Principles belonging to each dimension
+_PRINCIPLE_POSITIONS: Dict[str, List[int]] = {
+    'SC': [1, 2, 3, 4],          # Top
+    'SP': [5, 6, 7, 8, 9, 10],   # Top-right
+    'AT': [11, 12, 13, 14, 15, 16],  # Right
+    'Economy': [17],             # Bottom-right
+    'Method': [18, 19],          # Bottom
+    'Operator': [20],            # Bottom-left
+    'Reagent': [21, 22, 23, 24, 25],  # Left
+    'Waste': [26, 27]            # Top-left
+}
+
+# (8, 27) indicator of the principles in each sector (rows follow _SECTOR_ORDER,
+# columns are principles 1-27), and the number of principles per sector
+_DIM_INDICATOR = np.array([[pid in _PRINCIPLE_POSITIONS[dim] for pid in range(1, 28)]
+                           for dim in _SECTOR_ORDER], dtype=np.float64)
+_DIM_COUNTS = _DIM_INDICATOR.sum(axis=1)
+
+
+def _dim_averages(pc: np.ndarray, indicator: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Average the principle color values of each sector."""
+    return (indicator @ pc) / counts
+
+
+def _batch_dim_averages(pcs: np.ndarray, indicator: np.ndarray,
+                        counts: np.ndarray) -> np.ndarray:
+    """
+    Average the principle color values of each sector for many charts.
+    
+    Args:
+        pcs: (n, 27) array of principle color values, one row per chart
+        indicator: (8, 27) sector indicator matrix
+        counts: Number of principles in each sector
+        
+    Returns:
+        (n, 8) array of sector averages
+    """
+    return (pcs @ indicator.T) / counts
+
+
+if njit is not None:
+    try:
+        # Explicit signature compiles at import, so failures land in this guard
+        @njit('float64[:, :](float64[:, :], float64[:, :], float64[:])', cache=True)
+        def _batch_dim_averages_jit(pcs, indicator, counts):
+            """Average the principle color values of each sector (compiled loop)."""
+            n_charts, n_principles = pcs.shape
+            n_dims = indicator.shape[0]
+            averages = np.zeros((n_charts, n_dims))
+            for k in range(n_charts):
+                for i in range(n_dims):
+                    total = 0.0
+                    for j in range(n_principles):
+                        if indicator[i, j]:
+                            total += pcs[k, j]
+                    averages[k, i] = total / counts[i]
+            return averages
+    except Exception:
+        # Keep the NumPy version if numba cannot compile the function
+        pass
+    else:
+        _batch_dim_averages = _batch_dim_averages_jit
+
+# Default weights (w1-w8) used to normalize sector scores
+_SECTOR_WEIGHTS = np.array([0.1, 0.2, 0.2, 0.05, 0.05, 0.1, 0.1, 0.2])
+
+# Font for dimension letters and dimension scores
+_LABEL_FONT = {'fontsize': 13, 'fontfamily': 'Times New Roman'}
+
+
+def _build_static_labels(principle_font: dict) -> List[Tuple[float, float, str, dict]]:
+    """
+    Flatten the labels that never change between draws.
+    
+    Args:
+        principle_font: Font settings for the principle numbers
+        
+    Returns:
+        List of (x, y, text, fontdict) rows for the dimension letters
+        and the principle numbers
+    """
+    labels = [(x, y, label, _LABEL_FONT)
+              for label, (x, y) in _DIMENSION_LABEL_POSITIONS.items()]
+    labels.extend((x, y, str(num), principle_font)
+                  for num, (x, y) in _PRINCIPLE_LABEL_POSITIONS.items())
+    return labels
+
+
+# ============================================================================
+# Color Lookup
+# ============================================================================
+
+def _build_colormap_lut(colormap) -> np.ndarray:
+    """Materialize a colormap as an (N, 4) RGBA lookup table."""
+    return colormap(np.linspace(0, 1, colormap.N))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_colormap(color_items: Tuple) -> Tuple[mcolors.Colormap, np.ndarray]:
+    """
+    Build the ESAI colormap and its lookup table once per color configuration.
+    
+    Args:
+        color_items: Hashable form of ColorConfig.color_dict, i.e.
+            tuple(color_dict.items())
+            
+    Returns:
+        Tuple of (colormap, read-only RGBA lookup table)
+    """
+    colormap = mcolors.LinearSegmentedColormap('ESAI_ColorMap', dict(color_items))
+    lut = _build_colormap_lut(colormap)
+    lut.flags.writeable = False
+    return colormap, lut
+
+
+def _lookup_colors(lut: np.ndarray, values) -> np.ndarray:
+    """
+    Map values in [0, 1] to RGBA rows of a colormap lookup table.
+    
+    Uses the same binning as Colormap.__call__, so results match calling
+    the colormap directly while avoiding its per-call overhead.
+    """
+    n = len(lut)
+    index = (np.asarray(values, dtype=np.float64) * n).astype(np.int64)
+    return lut[np.clip(index, 0, n - 1)]
+
+
+def _principle_color_array(principle_colors: Dict[int, float]) -> np.ndarray:
+    """
+    Convert principle color values to a dense array indexed by principle.
+    
+    Args:
+        principle_colors: Dictionary mapping principle ID (1-27) to color value
+        
+    Returns:
+        Array of 27 color values ordered by principle ID (missing IDs are 0)
+    """
+    values = np.zeros(28, dtype=np.float64)
+    for pid, value in principle_colors.items():
+        if 1 <= pid <= 27:
+            values[pid] = value
+    return values[1:]
+
+
+# Vertical gradient image and score ticks for colorbars
+_GRADIENT = np.linspace(0, 1, 256).reshape(256, 1)
+_GRADIENT.flags.writeable = False
+_COLORBAR_TICKS = [0, 25, 50, 75, 100]
+
+
+# ============================================================================
+# Figure Output
+# ============================================================================
+
+def _png_save_kwargs(filepath: str, fast: bool) -> dict:
+    """
+    Get extra savefig arguments for fast PNG encoding.
+    
+    zlib level 1 is several times faster than the default level 6 at the
+    cost of larger files; the Software metadata chunk is skipped as well.
+    Other output formats are left untouched.
+    
+    Args:
+        filepath: Output file path
+        fast: Whether fast PNG encoding is requested
+        
+    Returns:
+        Keyword arguments for Figure.savefig
+    """
+    if fast and os.path.splitext(str(filepath))[1].lower() == '.png':
+        return {'pil_kwargs': {'compress_level': 1}, 'metadata': {'Software': None}}
+    return {}
+
 
 class RadarChart:
     """
@@ -36,16 +375,13 @@ class RadarChart:
     DIMENSION_SHORT = ['C', 'P', 'A', 'E', 'M', 'O', 'R', 'W']
     
     # Principle positions for each dimension
-    PRINCIPLE_POSITIONS = {
-        'SC': [1, 2, 3, 4],          # Top
-        'SP': [5, 6, 7, 8, 9, 10],   # Top-right
-        'AT': [11, 12, 13, 14, 15, 16],  # Right
-        'Economy': [17],             # Bottom-right
-        'Method': [18, 19],          # Bottom
-        'Operator': [20],            # Bottom-left
-        'Reagent': [21, 22, 23, 24, 25],  # Left
-        'Waste': [26, 27]            # Top-left
-    }
+    PRINCIPLE_POSITIONS = _PRINCIPLE_POSITIONS
+    
+    # Font for the principle numbers
+    _PRINCIPLE_FONT = {'fontsize': 9, 'fontfamily': 'Arial', 'fontweight': 100}
+    
+    # Sector polygon vertices keyed by (radius, width), shared across instances
+    _SECTOR_VERTS: Dict[Tuple[float, Optional[float]], np.ndarray] = {}
     
     def __init__(self, colors: Optional[ColorConfig] = None, figsize: Tuple[int, int] = (5, 5)):
         """
@@ -59,109 +395,31 @@ class RadarChart:
         self.figsize = figsize
         self.fig: Optional[Figure] = None
         self.ax = None
+        self._static_labels = _build_static_labels(self._PRINCIPLE_FONT)
         
         # Create colormap
         self._setup_colormap()
     
     def _setup_colormap(self):
         """Setup the color mapping."""
-        self.colormap = mcolors.LinearSegmentedColormap(
-            'ESAI_ColorMap',
-            self.colors.color_dict
-        )
-    
-    def _get_trapezoid_vertices(self) -> Dict:
-        """
-        Get all trapezoid vertices for the 27 principles.
-        
-        Returns:
-            Dictionary mapping principle IDs to their polygon vertices
-        """
-        vertices = {}
-        
-        # Top trapezoids (SC: principles 1-4)
-        vertices[1] = [(-2.7, 7), (-0.7, 7), (-0.7, 10), (-3.7, 10)]
-        vertices[2] = [(-0.7, 7), (0.7, 7), (0.7, 10), (-0.7, 10)]
-        vertices[3] = [(0.7, 7), (2.1, 7), (2.1, 10), (0.7, 10)]
-        vertices[4] = [(2.1, 7), (2.7, 7), (3.7, 10), (2.1, 10)]
-        
-        # Top-right trapezoids (SP: principles 5-10)
-        vertices[5] = [(3.2, 6.8), (3.8, 6.2), (5.8, 8.2), (4.2, 9.8)]
-        vertices[6] = [(3.8, 6.2), (5.8, 8.2), (6.3, 7.7), (4.3, 5.7)]
-        vertices[7] = [(4.3, 5.7), (6.3, 7.7), (7.3, 6.7), (5.3, 4.7)]
-        vertices[8] = [(5.3, 4.7), (7.3, 6.7), (8.3, 5.7), (6.3, 3.7)]
-        vertices[9] = [(6.3, 3.7), (8.3, 5.7), (8.8, 5.2), (6.8, 3.2)]
-        vertices[10] = [(6.8, 3.2), (8.8, 5.2), (9.8, 4.2), (6.8, 3.2)]
-        
-        # Right trapezoids (AT: principles 11-16)
-        vertices[11] = [(7, 1.8), (10, 1.8), (10, 3.7), (7, 2.7)]
-        vertices[12] = [(7, 1.8), (10, 1.8), (10, 1.2), (7, 1.2)]
-        vertices[13] = [(7, 1.2), (10, 1.2), (10, 0), (7, 0)]
-        vertices[14] = [(7, 0), (10, 0), (10, -1.2), (7, -1.2)]
-        vertices[15] = [(7, -1.2), (10, -1.2), (10, -1.8), (7, -1.8)]
-        vertices[16] = [(7, -1.8), (10, -1.8), (10, -3.7), (7, -2.7)]
-        
-        # Bottom-right trapezoid (Economy: principle 17)
-        vertices[17] = [(3.2, -6.8), (4.2, -9.8), (9.8, -4.2), (6.8, -3.2)]
-        
-        # Bottom trapezoids (Method: principles 18-19)
-        vertices[18] = [(2.7, -7), (3.7, -10), (0, -10), (0, -7)]
-        vertices[19] = [(-2.7, -7), (-3.7, -10), (0, -10), (0, -7)]
-        
-        # Bottom-left trapezoid (Operator: principle 20)
-        vertices[20] = [(-3.2, -6.8), (-4.2, -9.8), (-9.8, -4.2), (-6.8, -3.2)]
-        
-        # Left trapezoids (Reagent: principles 21-25)
-        vertices[21] = [(-7, -2.7), (-10, -3.7), (-10, -1.6), (-7, -1.6)]
-        vertices[22] = [(-7, -1.6), (-10, -1.6), (-10, -0.8), (-7, -0.8)]
-        vertices[23] = [(-7, -0.8), (-10, -0.8), (-10, 0), (-7, 0)]
-        vertices[24] = [(-7, 0), (-10, 0), (-10, 1.6), (-7, 1.6)]
-        vertices[25] = [(-7, 1.6), (-10, 1.6), (-10, 3.7), (-7, 2.7)]
-        
-        # Top-left trapezoids (Waste: principles 26-27)
-        vertices[26] = [(-5, 5), (-7, 7), (-9.8, 4.2), (-6.8, 3.2)]
-        vertices[27] = [(-3.2, 6.8), (-4.2, 9.8), (-7, 7), (-5, 5)]
-        
-        return vertices
-    
-    def _get_text_positions(self) -> Dict[int, Tuple[float, float]]:
-        """Get text label positions for each principle."""
-        return {
-            1: (-2, 8.5), 2: (0, 8.5), 3: (1.4, 8.5), 4: (2.7, 8.5),
-            5: (4.5, 7.8), 6: (5.1, 7), 7: (5.8, 6.2), 8: (6.8, 5.2),
-            9: (7.6, 4.5), 10: (8.3, 4.0),
-            11: (8.5, 2.5), 12: (8.5, 1.4), 13: (8.5, 0.4),
-            14: (8.5, -0.8), 15: (8.5, -1.6), 16: (8.5, -2.5),
-            17: (6.1, -5.9),
-            18: (1.5, -8.5), 19: (-1.5, -8.5),
-            20: (-6.1, -5.9),
-            21: (-8.5, -2.2), 22: (-8.5, -1.3), 23: (-8.5, -0.5),
-            24: (-8.5, 0.8), 25: (-8.5, 2.2),
-            26: (-7, 5), 27: (-5, 7)
-        }
+        self.colormap, self._cmap_lut = _get_colormap(tuple(self.colors.color_dict.items()))
     
-    def _get_dimension_label_positions(self) -> Dict[str, Tuple[float, float]]:
-        """Get positions for dimension labels."""
-        return {
-            'C': (0, 6), 'P': (4.2, 4.3), 'A': (6, 0),
-            'E': (4.2, -4.3), 'M': (0, -6), 'O': (-4.2, -4.3),
-            'R': (-6, 0), 'W': (-4.2, 4.3)
-        }
+    def _lookup(self, values) -> np.ndarray:
+        """Look up RGBA colors for values in [0, 1]."""
+        return _lookup_colors(self._cmap_lut, values)
     
     def _get_score_positions(self) -> Dict[str, Tuple[float, float]]:
         """Get positions for dimension score displays."""
-        return {
-            'SC': (0, 3.5), 'SP': (2.7, 2.6), 'AT': (3.5, 0),
-            'Economy': (2.7, -2.6), 'Method': (0, -3.5),
-            'Operator': (-2.7, -2.6), 'Reagent': (-3.5, 0),
-            'Waste': (-2.7, 2.6)
-        }
+        return _SCORE_POSITIONS
     
     def create_figure(self, dimension_scores: Dict[str, float],
                       principle_colors: Dict[int, float],
                       total_score: float) -> Figure:
         """
-        Create the radar chart figure.
+        Create a new radar chart figure.
+        
+        Each call returns an independent figure; use update_scores to
+        update the most recently created figure in place.
         
         Args:
             dimension_scores: Dictionary of dimension scores
@@ -176,7 +434,7 @@ class RadarChart:
         
         # Calculate colors
         dimension_colors = self._calculate_dimension_colors(dimension_scores)
-        center_color = mcolors.to_rgb(self.colormap(Normalize(0, 100)(total_score)))
+        center_color = self._lookup(total_score / 100)[:3]
         
         # Draw sectors (8 wedges)
         self._draw_sectors(dimension_colors)
@@ -198,111 +456,118 @@ class RadarChart:
         
         return self.fig
     
-    def _calculate_dimension_colors(self, dimension_scores: Dict[str, float]) -> List:
-        """Calculate colors for each dimension sector."""
-        weights = [0.1, 0.2, 0.2, 0.05, 0.05, 0.1, 0.1, 0.2]  # w1-w8 defaults
-        dimension_order = ['SP', 'SC', 'Waste', 'Reagent', 'Operator', 'Method', 'Economy', 'AT']
+    def update_scores(self, dimension_scores: Dict[str, float],
+                      principle_colors: Dict[int, float],
+                      total_score: float):
+        """
+        Update colors and score labels of an existing chart in place.
         
-        colors = []
-        for i, dim in enumerate(dimension_order):
-            score = dimension_scores.get(dim, 0)
-            max_score = 100 * weights[i] if i < len(weights) else 10
-            norm = Normalize(vmin=0, vmax=max_score)
-            colors.append(mcolors.to_rgb(self.colormap(norm(score))))
+        No artists are re-created, which keeps interactive redraws cheap
+        when the figure is embedded in a GUI canvas.
         
-        return colors
+        Args:
+            dimension_scores: Dictionary of dimension scores
+            principle_colors: Dictionary of principle color values (0-1)
+            total_score: Total ESAI score
+        """
+        if self.fig is None:
+            self.create_figure(dimension_scores, principle_colors, total_score)
+            return
+        
+        self._sector_collection.set_facecolors(self._calculate_dimension_colors(dimension_scores))
+        self._center_circle.set_facecolor(self._lookup(total_score / 100)[:3])
+        self._trapezoid_collection.set_facecolors(
+            self._lookup(_principle_color_array(principle_colors)))
+        
+        self._total_text.set_text(f'{total_score:.2f}')
+        for dim, text in self._score_texts.items():
+            text.set_text(f'{dimension_scores.get(dim, 0):.2f}')
+        
+        self.fig.canvas.draw_idle()
+    
+    def _calculate_dimension_colors(self, dimension_scores: Dict[str, float]) -> np.ndarray:
+        """Calculate colors for each dimension sector as an (8, 3) RGB array."""
+        scores = np.fromiter((dimension_scores.get(dim, 0) for dim in _SECTOR_ORDER),
+                             dtype=np.float64, count=len(_SECTOR_ORDER))
+        norm = np.clip(scores / (100 * _SECTOR_WEIGHTS), 0, 1)
+        return self._lookup(norm)[:, :3]
     
-    def _draw_sectors(self, colors: List):
+    @classmethod
+    def _get_sector_vertices(cls, radius: float, width: Optional[float] = None) -> np.ndarray:
+        """
+        Get polygon vertices for the 8 wedge sectors.
+        
+        Each arc is sampled at a fixed resolution so that all sectors share one
+        vertex count and can be drawn as a single PolyCollection. The geometry
+        is cached on the class and computed once per (radius, width).
+        
+        Args:
+            radius: Outer radius of the sectors
+            width: Ring width (None for full pie wedges)
+            
+        Returns:
+            Array of shape (8, N, 2) with the vertices of each sector
+        """
+        key = (radius, width)
+        if key not in cls._SECTOR_VERTS:
+            angle = 360 / 8
+            theta1 = np.arange(8) * angle + 22.5
+            # (8, 32) arc angles, in radians
+            arcs = np.deg2rad(np.linspace(theta1, theta1 + angle, 32, axis=1))
+            outer = radius * np.stack([np.cos(arcs), np.sin(arcs)], axis=-1)
+            if width is None:
+                center = np.zeros((8, 1, 2))
+                verts = np.concatenate([center, outer], axis=1)
+            else:
+                inner = (radius - width) / radius * outer[:, ::-1]
+                verts = np.concatenate([outer, inner], axis=1)
+            verts.flags.writeable = False
+            cls._SECTOR_VERTS[key] = verts
+        return cls._SECTOR_VERTS[key]
+    
+    def _draw_sectors(self, colors: np.ndarray):
         """Draw the 8 wedge sectors."""
-        center = (0, 0)
-        radius = 5
-        num_segments = 8
-        angle = 360 / num_segments
-        
-        for i in range(num_segments):
-            theta1 = i * angle + 22.5
-            theta2 = theta1 + angle
-            sector = Wedge(center, radius, theta1, theta2,
-                          edgecolor='black', facecolor=colors[i], linewidth=0.5)
-            self.ax.add_patch(sector)
+        self._sector_collection = PolyCollection(
+            self._get_sector_vertices(5), closed=True,
+            edgecolors='black', facecolors=colors, linewidths=0.5)
+        self.ax.add_collection(self._sector_collection)
     
     def _draw_center_circle(self, color, total_score: float):
         """Draw the center circle with total score."""
-        small_circle = Circle((0, 0), 2, edgecolor='black',
-                             facecolor=color, linewidth=0.5)
-        self.ax.add_patch(small_circle)
+        self._center_circle = Circle((0, 0), 2, edgecolor='black',
+                                     facecolor=color, linewidth=0.5)
+        self.ax.add_patch(self._center_circle)
     
     def _draw_trapezoids(self, principle_colors: Dict[int, float]):
         """Draw trapezoid polygons for each principle."""
-        vertices = self._get_trapezoid_vertices()
-        
-        for principle_id, verts in vertices.items():
-            color_value = principle_colors.get(principle_id, 0)
-            color = self.colormap(color_value)
-            
-            polygon = Polygon(verts, closed=True, edgecolor='black',
-                            facecolor=color, alpha=1, linewidth=0.5)
-            self.ax.add_patch(polygon)
+        # All trapezoids share one style, so draw them as a single collection
+        color_values = _principle_color_array(principle_colors)
+        self._trapezoid_collection = PolyCollection(
+            _TRAPEZOID_ARRAY, closed=True,
+            edgecolors='black', facecolors=self._lookup(color_values), linewidths=0.5)
+        self.ax.add_collection(self._trapezoid_collection)
     
     def _draw_outlines(self):
         """Draw outline frames for dimension groups."""
-        # Top frame (SC)
-        top_outline = [(-2.7, 7), (-3.7, 10), (3.7, 10), (2.7, 7)]
-        self.ax.add_patch(Polygon(top_outline, closed=True, edgecolor='black',
-                                  facecolor='none', linewidth=1))
-        
-        # Right-top frame (SP)
-        rt_outline = [(3.2, 6.8), (4.2, 9.8), (9.8, 4.2), (6.8, 3.2)]
-        self.ax.add_patch(Polygon(rt_outline, closed=True, edgecolor='black',
-                                  facecolor='none', linewidth=1))
-        
-        # Right frame (AT)
-        right_outline = [(7, -2.7), (10, -3.7), (10, 3.7), (7, 2.7)]
-        self.ax.add_patch(Polygon(right_outline, closed=True, edgecolor='black',
-                                  facecolor='none', linewidth=1))
-        
-        # Bottom frame (Method)
-        bottom_outline = [(-2.7, -7), (-3.7, -10), (3.7, -10), (2.7, -7)]
-        self.ax.add_patch(Polygon(bottom_outline, closed=True, edgecolor='black',
-                                  facecolor='none', linewidth=1))
-        
-        # Left-top frame (Waste)
-        lt_outline = [(-3.2, 6.8), (-4.2, 9.8), (-9.8, 4.2), (-6.8, 3.2)]
-        self.ax.add_patch(Polygon(lt_outline, closed=True, edgecolor='black',
-                                  facecolor='none', linewidth=1))
-        
-        # Left frame (Reagent)
-        left_outline = [(-7, -2.7), (-10, -3.7), (-10, 3.7), (-7, 2.7)]
-        self.ax.add_patch(Polygon(left_outline, closed=True, edgecolor='black',
-                                  facecolor='none', linewidth=1))
+        self.ax.add_collection(PolyCollection(_OUTLINE_POLYS, closed=True, facecolors='none',
+                                              edgecolors='black', linewidths=1))
     
     def _add_labels(self, dimension_scores: Dict[str, float], total_score: float):
         """Add all text labels to the chart."""
-        fontsize = 9
-        fontweight = 100
-        
         # Total score in center
-        self.ax.text(0, 0, f'{total_score:.2f}', ha='center', va='center',
-                    fontsize=20, fontfamily='Times New Roman')
+        self._total_text = self.ax.text(0, 0, f'{total_score:.2f}', ha='center', va='center',
+                                        fontsize=20, fontfamily='Times New Roman')
         
         # Dimension scores
-        score_positions = self._get_score_positions()
-        for dim, pos in score_positions.items():
+        self._score_texts = {}
+        for dim, (x, y) in self._get_score_positions().items():
             score = dimension_scores.get(dim, 0)
-            self.ax.text(pos[0], pos[1], f'{score:.2f}', ha='center', va='center',
-                        fontsize=13, fontfamily='Times New Roman')
-        
-        # Dimension labels
-        label_positions = self._get_dimension_label_positions()
-        for label, pos in label_positions.items():
-            self.ax.text(pos[0], pos[1], label, ha='center', va='center',
-                        fontsize=13, fontfamily='Times New Roman')
+            self._score_texts[dim] = self.ax.text(x, y, f'{score:.2f}', fontdict=_LABEL_FONT,
+                                                  ha='center', va='center')
         
-        # Principle numbers
-        text_positions = self._get_text_positions()
-        for num, pos in text_positions.items():
-            self.ax.text(pos[0], pos[1], str(num), ha='center', va='center',
-                        fontsize=fontsize, fontfamily='Arial', fontweight=fontweight)
+        # Dimension labels and principle numbers
+        for x, y, label, fontdict in self._static_labels:
+            self.ax.text(x, y, label, fontdict=fontdict, ha='center', va='center')
     
     def _configure_axes(self):
         """Configure the axes appearance."""
@@ -320,10 +585,27 @@ class RadarChart:
         self.fig.patch.set_facecolor('none')
         self.ax.set_facecolor('none')
     
-    def save_figure(self, filepath: str, dpi: int = 300):
-        """Save the figure to a file."""
+    def save_figure(self, filepath: str, dpi: int = 300, fast_png: bool = True,
+                    fast: bool = False):
+        """
+        Save the figure to a file.
+        
+        Args:
+            filepath: Output file path
+            dpi: Output resolution
+            fast_png: Use fast, light PNG compression (larger files)
+            fast: Save a low-resolution preview for thumbnails and on-screen
+                previews; overrides dpi with 100 and skips the tight bounding
+                box (fast_png still applies)
+        """
         if self.fig:
-            self.fig.savefig(filepath, dpi=dpi, bbox_inches='tight', facecolor='white')
+            if fast:
+                # Tight bbox needs an extra render pass; skip it for previews
+                dpi, bbox_inches = 100, None
+            else:
+                bbox_inches = 'tight'
+            self.fig.savefig(filepath, dpi=dpi, bbox_inches=bbox_inches, facecolor='white',
+                             **_png_save_kwargs(filepath, fast_png))
     
     def get_figure(self) -> Optional[Figure]:
         """Get the current figure."""
@@ -349,10 +631,7 @@ class ColorbarGenerator:
     
     def _setup_colormap(self):
         """Setup the color mapping."""
-        self.colormap = mcolors.LinearSegmentedColormap(
-            'ESAI_ColorMap',
-            self.colors.color_dict
-        )
+        self.colormap, _ = _get_colormap(tuple(self.colors.color_dict.items()))
     
     def draw(self, ax):
         """
@@ -361,52 +640,33 @@ class ColorbarGenerator:
         Args:
             ax: Matplotlib axes object
         """
-        import matplotlib.pyplot as plt
-        
-        norm = Normalize(vmin=0, vmax=100)
-        sm = plt.cm.ScalarMappable(norm=norm, cmap=self.colormap)
-        sm.set_array([])
-        
-        # Create a gradient image
-        gradient = np.linspace(0, 1, 256).reshape(256, 1)
-        ax.imshow(gradient, aspect='auto', cmap=self.colormap, origin='lower',
+        # Draw the gradient image
+        ax.imshow(_GRADIENT, aspect='auto', cmap=self.colormap, origin='lower',
                  extent=[0, 1, 0, 100])
         
         ax.set_ylabel('Score', fontsize=10)
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 100)
         ax.set_xticks([])
-        ax.set_yticks([0, 25, 50, 75, 100])
+        ax.set_yticks(_COLORBAR_TICKS)
     
-    def create_colorbar(self, filepath: str, figsize: Tuple[float, float] = (1, 3)):
+    def create_colorbar(self, filepath: str, figsize: Tuple[float, float] = (1, 3),
+                        fast_png: bool = True):
         """
         Create and save a colorbar image.
         
         Args:
             filepath: Output file path
             figsize: Figure size in inches
+            fast_png: Use fast, light PNG compression (larger files)
         """
-        fig, ax = plt.subplots(figsize=figsize)
-        
-        norm = Normalize(vmin=0, vmax=100)
-        sm = plt.cm.ScalarMappable(norm=norm, cmap=self.colormap)
+        # Plain Figure (no pyplot state), so colorbars can be generated headless
+        fig = Figure(figsize=figsize)
+        ax = fig.add_subplot(111)
+        self.draw(ax)
         
-        cbar = fig.colorbar(sm, ax=ax, pad=0.1, aspect=20)
-        cbar.ax.set_position([0.4, 0.1, 0.8, 0.8])
-        
-        # Set ticks
-        cbar.set_ticks([0, 50, 75, 100])
-        cbar.set_ticklabels(['0%', '50%', '75%', '100%'])
-        cbar.ax.tick_params(labelsize=10)
-        
-        # Hide axes
-        for spine in ax.spines.values():
-            spine.set_color('none')
-        ax.set_xticks([])
-        ax.set_yticks([])
-        
-        fig.savefig(filepath, dpi=300, bbox_inches='tight', pad_inches=0)
-        plt.close(fig)
+        fig.savefig(filepath, dpi=300, bbox_inches='tight', pad_inches=0,
+                    **_png_save_kwargs(filepath, fast_png))
 
 
 class RadarChartSimple:
@@ -415,85 +675,153 @@ class RadarChartSimple:
     Used for tkinter embedding.
     """
     
-    def __init__(self, ax, colormap):
+    # Font for the principle numbers
+    _PRINCIPLE_FONT = {'fontsize': 8, 'fontfamily': 'Arial'}
+    
+    # Delay before a requested redraw is flushed on a Tk canvas (~60 Hz)
+    REDRAW_DELAY_MS = 16
+    
+    def __init__(self, ax, colormap, disp_skip: int = 0):
         """
         Initialize with an existing axis and colormap.
         
         Args:
             ax: Matplotlib axes object
             colormap: Colormap to use for colors
+            disp_skip: Number of draw requests to skip between renders when
+                the axis is not on a Tk canvas (0 draws every request)
         """
         self.ax = ax
         self.colormap = colormap
+        self._cmap_lut = _build_colormap_lut(colormap)
+        self._static_labels = _build_static_labels(self._PRINCIPLE_FONT)
+        
+        # Redraw throttling state
+        self.disp_skip = disp_skip
+        self._skip_counter = 0
+        self._pending = False
+        self._pending_args = None
+    
+    def request_draw(self, principle_colors: Dict[int, float],
+                     total_score: float, dimension_scores: Dict[str, float] = None):
+        """
+        Request a redraw, coalescing rapid successive requests.
+        
+        On a Tk canvas the draw is deferred by REDRAW_DELAY_MS and only the
+        most recent arguments are rendered. Elsewhere, a request is drawn and
+        the next disp_skip requests are skipped; call flush() to render a
+        skipped state.
+        
+        Args:
+            principle_colors: Dictionary mapping principle ID to color value (0-1)
+            total_score: Total ESAI score (sum of all dimensions)
+            dimension_scores: Dictionary of dimension scores (sum of principles)
+        """
+        self._pending_args = (principle_colors, total_score, dimension_scores)
+        
+        widget = self._get_tk_widget()
+        if widget is not None:
+            if not self._pending:
+                self._pending = True
+                widget.after(self.REDRAW_DELAY_MS, self.flush)
+            return
+        
+        if self._skip_counter > 0:
+            self._skip_counter -= 1
+            self._pending = True
+            return
+        
+        self._skip_counter = self.disp_skip
+        self.flush()
+    
+    def flush(self):
+        """Draw the most recently requested state, if one is pending."""
+        if self._pending_args is None:
+            return
+        
+        args = self._pending_args
+        self._pending_args = None
+        self._pending = False
+        
+        self.draw(*args)
+        self.ax.figure.canvas.draw_idle()
+    
+    def _get_tk_widget(self):
+        """Get the Tk widget hosting the axis, or None if not on a Tk canvas."""
+        get_tk_widget = getattr(self.ax.figure.canvas, 'get_tk_widget', None)
+        return get_tk_widget() if get_tk_widget is not None else None
+    
+    def _lookup(self, values) -> np.ndarray:
+        """Look up RGBA colors for values in [0, 1]."""
+        return _lookup_colors(self._cmap_lut, values)
     
     def draw(self, principle_colors: Dict[int, float], 
              total_score: float, dimension_scores: Dict[str, float] = None):
         """
         Draw the radar chart on the axis.
         
+        The axis is cleared and all artists are created on the first call.
+        Later calls only update colors and texts of the existing artists,
+        which are cached on the axis and shared by charts drawing on it.
+        
         Args:
             principle_colors: Dictionary mapping principle ID to color value (0-1)
             total_score: Total ESAI score (sum of all dimensions)
             dimension_scores: Dictionary of dimension scores (sum of principles)
         """
-        from matplotlib.patches import Circle, Wedge, Polygon
+        artists = self._get_artists()
         
-        # Clear axis
-        self.ax.clear()
+        # Center circle color
+        artists['center'].set_facecolor(self._lookup(total_score / 100)[:3])
         
-        # Calculate center color
-        center_color = mcolors.to_rgb(self.colormap(Normalize(0, 100)(total_score)))
+        # Trapezoids for each principle
+        color_values = _principle_color_array(principle_colors)
+        artists['trapezoids'].set_facecolors(self._lookup(color_values))
         
-        # Draw main circle outline
-        main_circle = Circle((0, 0), 5, edgecolor='black', facecolor='none', linewidth=0.5)
-        self.ax.add_patch(main_circle)
+        # Dimension sectors: average color of the dimension's principles
+        sector_colors = _dim_averages(color_values, _DIM_INDICATOR, _DIM_COUNTS)
+        artists['sectors'].set_facecolors(self._lookup(sector_colors))
         
-        # Draw center circle
-        small_circle = Circle((0, 0), 2, edgecolor='black', facecolor=center_color, linewidth=0.5)
-        self.ax.add_patch(small_circle)
+        # Text labels
+        self._update_labels(artists, total_score, dimension_scores)
+    
+    def _get_artists(self) -> dict:
+        """Get the chart artists cached on the axis, creating them if needed."""
+        artists = getattr(self.ax, '_esai_cache', None)
+        # Clearing the axis detaches the cached artists, so rebuild them
+        if artists is None or artists['center'].axes is not self.ax:
+            artists = self._create_artists()
+            self.ax._esai_cache = artists
+        return artists
+    
+    def _create_artists(self) -> dict:
+        """
+        Clear the axis and create all chart artists with neutral colors.
         
-        # Draw dimension sectors (8 wedges)
-        dimension_order = ['SP', 'SC', 'Waste', 'Reagent', 'Operator', 'Method', 'Economy', 'AT']
+        Returns:
+            Dictionary of the artists updated on each draw
+        """
+        self.ax.clear()
         
-        angle = 360 / 8
-        for i, dim in enumerate(dimension_order):
-            theta1 = i * angle + 22.5
-            theta2 = theta1 + angle
-            
-            # Get average color for dimension
-            dim_principles = {
-                'SC': [1, 2, 3, 4],
-                'SP': [5, 6, 7, 8, 9, 10],
-                'AT': [11, 12, 13, 14, 15, 16],
-                'Economy': [17],
-                'Method': [18, 19],
-                'Operator': [20],
-                'Reagent': [21, 22, 23, 24, 25],
-                'Waste': [26, 27]
-            }
-            
-            principles = dim_principles.get(dim, [])
-            if principles:
-                avg_color = sum(principle_colors.get(p, 0) for p in principles) / len(principles)
-            else:
-                avg_color = 0
-            
-            color = self.colormap(avg_color)
-            sector = Wedge((0, 0), 5, theta1, theta2, width=3,
-                          edgecolor='black', facecolor=color, linewidth=0.5)
-            self.ax.add_patch(sector)
-        
-        # Draw trapezoids for each principle
-        vertices = self._get_trapezoid_vertices()
-        for pid, verts in vertices.items():
-            color_val = principle_colors.get(pid, 0)
-            color = self.colormap(color_val)
-            polygon = Polygon(verts, closed=True, edgecolor='black',
-                            facecolor=color, alpha=1, linewidth=0.5)
-            self.ax.add_patch(polygon)
-        
-        # Add text labels
-        self._add_labels(total_score, dimension_scores)
+        # Main circle outline and center circle
+        self.ax.add_patch(Circle((0, 0), 5, edgecolor='black', facecolor='none', linewidth=0.5))
+        center = Circle((0, 0), 2, edgecolor='black', linewidth=0.5)
+        self.ax.add_patch(center)
+        
+        # Dimension sectors (8 wedges)
+        sectors = PolyCollection(
+            RadarChart._get_sector_vertices(5, 3), closed=True,
+            edgecolors='black', linewidths=0.5)
+        self.ax.add_collection(sectors)
+        
+        # Trapezoids for each principle
+        trapezoids = PolyCollection(
+            _SIMPLE_TRAPEZOID_ARRAY, closed=True,
+            edgecolors='black', linewidths=0.5)
+        self.ax.add_collection(trapezoids)
+        
+        # Text labels
+        total_text, score_texts = self._add_labels()
         
         # Configure axes - ensure full visibility with padding
         self.ax.set_xlim(-11.5, 11.5)
@@ -504,109 +832,42 @@ class RadarChartSimple:
             spine.set_visible(False)
         self.ax.set_xticks([])
         self.ax.set_yticks([])
+        
+        return {'center': center, 'sectors': sectors, 'trapezoids': trapezoids,
+                'total_text': total_text, 'score_texts': score_texts}
     
-    def _get_trapezoid_vertices(self) -> Dict:
-        """Get trapezoid vertices for principles."""
-        vertices = {}
-        
-        # Top trapezoids (SC: principles 1-4)
-        vertices[1] = [(-2.7, 7), (-0.7, 7), (-0.7, 10), (-3.7, 10)]
-        vertices[2] = [(-0.7, 7), (0.7, 7), (0.7, 10), (-0.7, 10)]
-        vertices[3] = [(0.7, 7), (2.1, 7), (2.1, 10), (0.7, 10)]
-        vertices[4] = [(2.1, 7), (2.7, 7), (3.7, 10), (2.1, 10)]
-        
-        # Top-right trapezoids (SP: principles 5-10)
-        vertices[5] = [(3.2, 6.8), (3.8, 6.2), (5.8, 8.2), (4.2, 9.8)]
-        vertices[6] = [(3.8, 6.2), (4.3, 5.7), (6.3, 7.7), (5.8, 8.2)]
-        vertices[7] = [(4.3, 5.7), (5.3, 4.7), (7.3, 6.7), (6.3, 7.7)]
-        vertices[8] = [(5.3, 4.7), (6.3, 3.7), (8.3, 5.7), (7.3, 6.7)]
-        vertices[9] = [(6.3, 3.7), (6.8, 3.2), (8.8, 5.2), (8.3, 5.7)]
-        vertices[10] = [(6.8, 3.2), (9.8, 4.2), (8.8, 5.2), (6.8, 3.2)]
-        
-        # Right trapezoids (AT: principles 11-16) - fixed vertex order
-        vertices[11] = [(7, 2.7), (10, 3.7), (10, 1.8), (7, 1.8)]
-        vertices[12] = [(7, 1.8), (10, 1.8), (10, 1.2), (7, 1.2)]
-        vertices[13] = [(7, 1.2), (10, 1.2), (10, 0), (7, 0)]
-        vertices[14] = [(7, 0), (10, 0), (10, -1.2), (7, -1.2)]
-        vertices[15] = [(7, -1.2), (10, -1.2), (10, -1.8), (7, -1.8)]
-        vertices[16] = [(7, -1.8), (10, -1.8), (10, -3.7), (7, -2.7)]
-        
-        # Bottom-right trapezoid (Economy: principle 17)
-        vertices[17] = [(3.2, -6.8), (4.2, -9.8), (9.8, -4.2), (6.8, -3.2)]
-        
-        # Bottom trapezoids (Method: principles 18-19)
-        vertices[18] = [(0, -7), (0, -10), (3.7, -10), (2.7, -7)]
-        vertices[19] = [(0, -7), (0, -10), (-3.7, -10), (-2.7, -7)]
-        
-        # Bottom-left trapezoid (Operator: principle 20)
-        vertices[20] = [(-3.2, -6.8), (-6.8, -3.2), (-9.8, -4.2), (-4.2, -9.8)]
-        
-        # Left trapezoids (Reagent: principles 21-25)
-        vertices[21] = [(-7, -1.6), (-10, -1.6), (-10, -3.7), (-7, -2.7)]
-        vertices[22] = [(-7, -0.8), (-10, -0.8), (-10, -1.6), (-7, -1.6)]
-        vertices[23] = [(-7, 0), (-10, 0), (-10, -0.8), (-7, -0.8)]
-        vertices[24] = [(-7, 1.6), (-10, 1.6), (-10, 0), (-7, 0)]
-        vertices[25] = [(-7, 2.7), (-10, 3.7), (-10, 1.6), (-7, 1.6)]
-        
-        # Top-left trapezoids (Waste: principles 26-27)
-        vertices[26] = [(-5, 5), (-6.8, 3.2), (-9.8, 4.2), (-7, 7)]
-        vertices[27] = [(-3.2, 6.8), (-5, 5), (-7, 7), (-4.2, 9.8)]
-        
-        return vertices
-    
-    def _add_labels(self, total_score: float, dimension_scores: Dict[str, float] = None):
-        """Add text labels."""
+    def _add_labels(self):
+        """
+        Add text labels; score texts are filled in by _update_labels.
+        
+        Returns:
+            Tuple of (total score text, dict of dimension score texts)
+        """
         # Total score in center
-        self.ax.text(0, 0, f'{total_score:.2f}', ha='center', va='center',
-                    fontsize=16, fontfamily='Times New Roman')
+        total_text = self.ax.text(0, 0, '', ha='center', va='center',
+                                  fontsize=16, fontfamily='Times New Roman')
         
         # Dimension scores (in inner sectors)
-        if dimension_scores:
-            score_positions = {
-                'SC': (0, 3.5), 
-                'SP': (2.7, 2.6), 
-                'AT': (3.5, 0.0),
-                'Economy': (2.7, -2.6), 
-                'Method': (0.0, -3.5),
-                'Operator': (-2.7, -2.6), 
-                'Reagent': (-3.5, 0.0),
-                'Waste': (-2.7, 2.6)
-            }
-            
-            for dim, pos in score_positions.items():
-                score = dimension_scores.get(dim, 0)
-                self.ax.text(pos[0], pos[1], f'{score:.2f}', ha='center', va='center',
-                            fontsize=13, fontfamily='Times New Roman')
-        
-        # Dimension labels (outer ring)
-        dim_labels = {
-            'C': (0, 6), 'P': (4.2, 4.3), 'A': (6, 0),
-            'E': (4.2, -4.3), 'M': (0, -6), 'O': (-4.2, -4.3),
-            'R': (-6, 0), 'W': (-4.2, 4.3)
+        score_texts = {
+            dim: self.ax.text(x, y, '', fontdict=_LABEL_FONT, ha='center', va='center')
+            for dim, (x, y) in _SCORE_POSITIONS.items()
         }
         
-        for label, pos in dim_labels.items():
-            self.ax.text(pos[0], pos[1], label, ha='center', va='center',
-                        fontsize=13, fontfamily='Times New Roman')
-        
-        # Principle numbers
-        principle_positions = {
-            1: (-2, 8.5), 2: (0, 8.5), 3: (1.4, 8.5), 4: (2.7, 8.5),
-            5: (4.5, 7.8), 6: (5.1, 7), 7: (5.8, 6.2), 8: (6.8, 5.2),
-            9: (7.6, 4.5), 10: (8.3, 4.0),
-            11: (8.5, 2.5), 12: (8.5, 1.4), 13: (8.5, 0.4),
-            14: (8.5, -0.8), 15: (8.5, -1.6), 16: (8.5, -2.5),
-            17: (6.1, -5.9),
-            18: (1.5, -8.5), 19: (-1.5, -8.5),
-            20: (-6.1, -5.9),
-            21: (-8.5, -2.2), 22: (-8.5, -1.3), 23: (-8.5, -0.5),
-            24: (-8.5, 0.8), 25: (-8.5, 2.2),
-            26: (-7, 5), 27: (-5, 7)
-        }
+        # Dimension labels (outer ring) and principle numbers
+        for x, y, label, fontdict in self._static_labels:
+            self.ax.text(x, y, label, fontdict=fontdict, ha='center', va='center')
         
-        for num, pos in principle_positions.items():
-            self.ax.text(pos[0], pos[1], str(num), ha='center', va='center',
-                        fontsize=8, fontfamily='Arial')
+        return total_text, score_texts
+    
+    def _update_labels(self, artists: dict, total_score: float,
+                       dimension_scores: Dict[str, float] = None):
+        """Update the total and dimension score texts."""
+        artists['total_text'].set_text(f'{total_score:.2f}')
+        
+        for dim, text in artists['score_texts'].items():
+            if dimension_scores:
+                text.set_text(f'{dimension_scores.get(dim, 0):.2f}')
+            text.set_visible(bool(dimension_scores))
 
 
 def create_radar_chart(colors: ColorConfig = None) -> RadarChart:
@@ -0,0 +1,86 @@
+"""
+Test script to verify the sector averaging helpers.
+The batch helper (compiled with numba when available) must match the NumPy version.
+"""
+import sys
+import os
+from importlib.util import find_spec
+
+# Add project path
+project_dir = os.path.dirname(os.path.abspath(__file__))
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+import numpy as np
+
+import esai.visualization as visualization
+from esai.visualization import (_DIM_INDICATOR, _DIM_COUNTS, _PRINCIPLE_POSITIONS,
+                                _SECTOR_ORDER, _dim_averages, _batch_dim_averages)
+
+
+def test_dim_averages():
+    """Test that sector averages match a plain Python average"""
+    print("Test 1: Sector averages")
+    
+    rng = np.random.default_rng(0)
+    pc = rng.random(27)
+    averages = _dim_averages(pc, _DIM_INDICATOR, _DIM_COUNTS)
+    
+    for i, dim in enumerate(_SECTOR_ORDER):
+        values = [pc[pid - 1] for pid in _PRINCIPLE_POSITIONS[dim]]
+        expected = sum(values) / len(values)
+        assert np.isclose(averages[i], expected), \
+            f"{dim}: expected {expected}, got {averages[i]}"
+    print(f"✓ All {len(_SECTOR_ORDER)} sector averages are correct")
+    
+    return True
+
+
+def test_batch_matches_numpy():
+    """Test that the batch helper matches the NumPy version row by row"""
+    print("\nTest 2: Batch sector averages")
+    
+    numba_available = find_spec('numba') is not None
+    compiled = hasattr(visualization, '_batch_dim_averages_jit')
+    print(f"  numba importable: {numba_available}, batch helper compiled: {compiled}")
+    if numba_available and not getattr(sys, 'frozen', False):
+        assert compiled, "numba is importable but the batch helper was not compiled"
+    
+    rng = np.random.default_rng(1)
+    pcs = rng.random((50, 27))
+    expected = np.array([_dim_averages(pc, _DIM_INDICATOR, _DIM_COUNTS) for pc in pcs])
+    
+    result = _batch_dim_averages(pcs, _DIM_INDICATOR, _DIM_COUNTS)
+    assert result.shape == (50, len(_SECTOR_ORDER)), f"Unexpected shape {result.shape}"
+    assert np.allclose(result, expected), "Batch averages differ from the NumPy version"
+    print(f"✓ Batch averages match the NumPy version for {len(pcs)} charts")
+    
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("=" * 70)
+    print("Sector Averaging Test")
+    print("=" * 70)
+    print()
+    
+    try:
+        test_dim_averages()
+        test_batch_matches_numpy()
+        
+        print("\n" + "=" * 70)
+        print("✅ All tests passed!")
+        print("=" * 70)
+        return True
+        
+    except AssertionError as e:
+        print("\n" + "=" * 70)
+        print("❌ Test failed")
+        print("=" * 70)
+        print(f"Error: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -5,19 +5,29 @@ Verify that radar chart functionality still works correctly after removing exec(
 
 import sys
 import os
+from io import BytesIO
+from pathlib import Path
 
-# Add project path
-project_dir = os.path.dirname(os.path.abspath(__file__))
+# Add project path (__file__ is usually absolute already, so skip the getcwd lookup)
+project_dir = os.path.dirname(__file__)
+if not os.path.isabs(project_dir):
+    project_dir = os.path.abspath(project_dir)
 if project_dir not in sys.path:
     sys.path.insert(0, project_dir)
 
 import matplotlib
 matplotlib.use('Agg')  # Use non-GUI backend for testing
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.patches import Wedge
+from matplotlib.collections import PatchCollection
 import numpy as np
 
+# Source of ESAI.py read once as bytes (None if the file does not exist)
+_ESAI_FILE = os.path.join(project_dir, 'ESAI.py')
+_ESAI_BYTES = Path(_ESAI_FILE).read_bytes() if os.path.exists(_ESAI_FILE) else None
+
 def test_radar_chart_without_exec():
     """Test radar chart creation without using exec()"""
     
@@ -33,11 +43,13 @@ def test_radar_chart_without_exec():
     
     sectors = []
     
+    # Start and end angle of each sector
+    thetas1 = np.arange(num_segments, dtype=np.float64) * angle + 22.5
+    thetas2 = thetas1 + angle
+    
     # Create sectors (exec() statement removed)
     for i in range(num_segments):
-        theta1 = i * angle + 22.5
-        theta2 = theta1 + angle
-        sector = Wedge(center, radius, theta1, theta2, 
+        sector = Wedge(center, radius, thetas1[i], thetas2[i], 
                       edgecolor='black', facecolor=colors[i], linewidth=0.5)
         sectors.append(sector)
         # Note: No exec(f"sector{i + 1} = sectors[{i}]") here
@@ -47,31 +59,25 @@ def test_radar_chart_without_exec():
     print(f"✓ Successfully created {len(sectors)} sectors")
     
     # Create figure and add sectors
-    fig, ax = plt.subplots(figsize=(8, 8))
+    fig = Figure(figsize=(8, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
     ax.set_aspect('equal')
     
-    # Add all sectors to axes
-    for sector in sectors:
-        ax.add_patch(sector)
+    # Add all sectors to axes as a single collection
+    ax.add_collection(PatchCollection(sectors, match_original=True), autolim=False)
     
     print("✓ All sectors successfully added to figure")
     
-    # Save figure to verify rendering
-    output_file = os.path.join(project_dir, 'test_radar_output.png')
-    plt.savefig(output_file, dpi=100, bbox_inches='tight')
-    plt.close()
-    
-    # Verify file was created
-    assert os.path.exists(output_file), "Radar chart output file was not created"
-    file_size = os.path.getsize(output_file)
-    print(f"✓ Radar chart saved: {output_file} ({file_size:,} bytes)")
+    # Render figure to memory to verify rendering
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=100)
     
-    # Clean up test file
-    if os.path.exists(output_file):
-        os.remove(output_file)
-        print("✓ Test file cleaned up")
+    # Verify image data was produced
+    assert buf.tell() > 0, "Radar chart was not rendered"
+    print(f"✓ Radar chart rendered ({buf.tell():,} bytes)")
     
     print("\nTest 2: Verify that sector1, sector2, etc. variables are not needed")
     
@@ -92,9 +98,8 @@ def test_radar_chart_without_exec():
     print("\nTest 3: Verify exec() is indeed not being used")
     
     # Confirm that sector1, sector2, etc. local variables do not exist
-    local_vars = locals()
-    exec_created_vars = [f'sector{i+1}' for i in range(num_segments) 
-                         if f'sector{i+1}' in local_vars]
+    expected_names = {f'sector{i+1}' for i in range(num_segments)}
+    exec_created_vars = expected_names & locals().keys()
     
     assert len(exec_created_vars) == 0, \
         f"There should be no exec()-created variables, but found: {exec_created_vars}"
@@ -108,23 +113,16 @@ def test_code_quality():
     
     print("\nTest 4: Code quality verification")
     
-    # Read ESAI.py and verify no exec() statements
-    esai_file = os.path.join(project_dir, 'ESAI.py')
-    
-    if os.path.exists(esai_file):
-        with open(esai_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Search for exec() usage
-        exec_count = content.count('exec(f"sector')
-        
-        assert exec_count == 0, \
-            f"ESAI.py should not contain exec(f\"sector...\"), but found {exec_count} instances"
+    # Verify no exec() statements in ESAI.py
+    if _ESAI_BYTES is not None:
+        # Search for exec() usage (stops at the first occurrence)
+        assert b'exec(f"sector' not in _ESAI_BYTES, \
+            "ESAI.py should not contain exec(f\"sector...\")"
         
         print("✓ All exec() statements removed from ESAI.py")
         
         # Verify sectors list is still in use
-        assert 'sectors = []' in content or 'sectors=[]' in content, \
+        assert b'sectors = []' in _ESAI_BYTES or b'sectors=[]' in _ESAI_BYTES, \
             "ESAI.py should still use sectors list"
         
         print("✓ sectors list is still in use")
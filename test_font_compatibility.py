@@ -2,45 +2,54 @@
 Test script to verify matplotlib font configuration works across different systems.
 This addresses the reviewer's concern about hardcoded Chinese fonts.
 """
+from io import BytesIO
+
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for testing
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import matplotlib.font_manager as fm
 
+# Names of all fonts installed on this system
+_AVAILABLE_FONTS = frozenset(f.name for f in fm.fontManager.ttflist)
+
+# List of fonts the application tries to use, in order of preference
+_PREFERRED_FONTS = (
+    'SimHei',
+    'Microsoft YaHei',
+    'STHeiti',
+    'WenQuanYi Micro Hei',
+    'Noto Sans CJK SC',
+    'Source Han Sans CN',
+    'PingFang SC',
+    'Hiragino Sans GB',
+    'DejaVu Sans',
+    'Arial',
+    'Helvetica'
+)
+
+# Preferred fonts installed on this system
+_AVAILABLE_PREFERRED = [font for font in _PREFERRED_FONTS if font in _AVAILABLE_FONTS]
+
+# Figure shared by the rendering tests; cleared before each use
+_FIG = Figure(figsize=(8, 6))
+_CANVAS = FigureCanvasAgg(_FIG)
+_AX = _FIG.add_subplot(111)
+
 def test_font_availability():
     """Test which fonts are available on the current system"""
     print("="*60)
     print("FONT AVAILABILITY TEST")
     print("="*60)
     
-    # List of fonts the application tries to use
-    preferred_fonts = [
-        'SimHei',
-        'Microsoft YaHei',
-        'STHeiti',
-        'WenQuanYi Micro Hei',
-        'Noto Sans CJK SC',
-        'Source Han Sans CN',
-        'PingFang SC',
-        'Hiragino Sans GB',
-        'DejaVu Sans',
-        'Arial',
-        'Helvetica'
-    ]
-    
-    # Get available fonts
-    available_fonts = set(f.name for f in fm.fontManager.ttflist)
-    
     print("\nChecking preferred fonts:")
-    found_fonts = []
-    for font in preferred_fonts:
-        available = "✓" if font in available_fonts else "✗"
-        status = "AVAILABLE" if font in available_fonts else "NOT FOUND"
+    for font in _PREFERRED_FONTS:
+        available = "✓" if font in _AVAILABLE_FONTS else "✗"
+        status = "AVAILABLE" if font in _AVAILABLE_FONTS else "NOT FOUND"
         print(f"  {available} {font}: {status}")
-        if font in available_fonts:
-            found_fonts.append(font)
     
-    print(f"\nFound {len(found_fonts)} out of {len(preferred_fonts)} preferred fonts")
+    found_fonts = list(_AVAILABLE_PREFERRED)
+    print(f"\nFound {len(found_fonts)} out of {len(_PREFERRED_FONTS)} preferred fonts")
     
     if found_fonts:
         print(f"✓ Will use: {', '.join(found_fonts[:3])}")
@@ -56,49 +65,44 @@ def test_chinese_character_rendering():
     print("="*60)
     
     # Configure fonts using the same logic as ESAI.py
-    font_candidates = [
-        'SimHei', 'Microsoft YaHei', 'STHeiti', 'WenQuanYi Micro Hei',
-        'Noto Sans CJK SC', 'Source Han Sans CN', 'PingFang SC',
-        'Hiragino Sans GB', 'DejaVu Sans', 'Arial', 'Helvetica', 'sans-serif'
-    ]
-    
-    available_fonts = set(f.name for f in fm.fontManager.ttflist)
-    available_candidates = [font for font in font_candidates if font in available_fonts]
+    available_candidates = _AVAILABLE_PREFERRED
     
+    # Settings only apply while rendering and are restored afterwards
+    rc = {'axes.unicode_minus': False}
     if available_candidates:
-        matplotlib.rcParams['font.sans-serif'] = available_candidates
-    
-    matplotlib.rcParams['axes.unicode_minus'] = False
+        rc['font.sans-serif'] = available_candidates
     
     try:
-        # Create a test plot with various text
-        fig, ax = plt.subplots(figsize=(8, 6))
-        
-        test_texts = [
-            "Environmental Suitability Assessment Index (ESAI)",
-            "Sample Collection Module",
-            "Reagent Usage Analysis",
-            "Test: Mixed Font Rendering"
-        ]
-        
-        for i, text in enumerate(test_texts):
-            ax.text(0.5, 0.7 - i*0.15, text, 
-                   ha='center', va='center', fontsize=10,
-                   transform=ax.transAxes)
-        
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        ax.axis('off')
-        ax.set_title('Font Rendering Test', fontsize=14, pad=20)
-        
-        # Save to file
-        output_file = 'font_test_output.png'
-        plt.savefig(output_file, dpi=100, bbox_inches='tight')
-        plt.close()
-        
-        print(f"✓ Successfully rendered test plot")
-        print(f"  Output saved to: {output_file}")
-        print(f"  Font configuration: {matplotlib.rcParams['font.sans-serif'][:3]}")
+        with matplotlib.rc_context(rc):
+            # Create a test plot with various text
+            ax = _AX
+            ax.clear()
+            # Hide axis decorations first so no tick artists are drawn
+            ax.set_axis_off()
+            
+            test_texts = [
+                "Environmental Suitability Assessment Index (ESAI)",
+                "Sample Collection Module",
+                "Reagent Usage Analysis",
+                "Test: Mixed Font Rendering"
+            ]
+            
+            transform = ax.transAxes
+            for i, text in enumerate(test_texts):
+                ax.text(0.5, 0.7 - i*0.15, text, 
+                       ha='center', va='center', fontsize=10,
+                       transform=transform)
+            
+            ax.set_xlim(0, 1)
+            ax.set_ylim(0, 1)
+            
+            # Render to memory
+            buf = BytesIO()
+            _FIG.savefig(buf, format='png', dpi=100)
+            
+            print(f"✓ Successfully rendered test plot")
+            print(f"  Output size: {buf.tell():,} bytes")
+            print(f"  Font configuration: {matplotlib.rcParams['font.sans-serif'][:3]}")
         
         # Check if any font warnings were generated
         chinese_fonts = ['SimHei', 'Microsoft YaHei', 'STHeiti', 
@@ -126,18 +130,15 @@ def test_font_fallback_mechanism():
     # Simulate scenario with no preferred fonts
     print("\nSimulating system with no preferred fonts...")
     
-    original_fonts = matplotlib.rcParams['font.sans-serif'].copy()
-    
     try:
-        # Set to non-existent fonts
-        matplotlib.rcParams['font.sans-serif'] = ['NonExistentFont1', 'NonExistentFont2']
-        
-        # Try to create a plot
-        fig, ax = plt.subplots(figsize=(6, 4))
-        ax.text(0.5, 0.5, 'Fallback Test', ha='center', va='center')
-        ax.axis('off')
-        plt.savefig('fallback_test.png', dpi=100)
-        plt.close()
+        # Set to non-existent fonts; original settings are restored on exit
+        with matplotlib.rc_context({'font.sans-serif': ['NonExistentFont1', 'NonExistentFont2']}):
+            # Try to create a plot
+            ax = _AX
+            ax.clear()
+            ax.set_axis_off()
+            ax.text(0.5, 0.5, 'Fallback Test', ha='center', va='center')
+            _FIG.savefig(BytesIO(), format='png', dpi=100)
         
         print("✓ Application handled missing fonts gracefully")
         print("  Matplotlib fell back to system defaults successfully")
@@ -146,9 +147,6 @@ def test_font_fallback_mechanism():
     except Exception as e:
         print(f"✗ Error with font fallback: {e}")
         return False
-    finally:
-        # Restore original settings
-        matplotlib.rcParams['font.sans-serif'] = original_fonts
 
 def main():
     print("\n" + "="*70)
@@ -191,15 +189,6 @@ def main():
         print("\n⚠ Some tests had issues, but the application should still work.")
         print("Check the output above for details.")
     
-    # Cleanup test files
-    import os
-    for file in ['font_test_output.png', 'fallback_test.png']:
-        try:
-            if os.path.exists(file):
-                os.remove(file)
-        except:
-            pass
-    
     return passed_count >= 2  # Pass if at least 2/3 tests pass
 
 if __name__ == "__main__":
@@ -3,8 +3,9 @@ Comprehensive integration test for both reviewer fixes:
 1. Locale compatibility
 2. Font compatibility
 """
+import os
 import sys
-import subprocess
+from importlib.util import find_spec
 
 def test_import_without_crash():
     """Test that ESAI.py imports without crashing"""
@@ -30,66 +31,52 @@ def test_locale_and_font_handling():
     print("INTEGRATION TEST: Locale + Font Configuration")
     print("="*70)
     
-    test_code = """
-import os
-import sys
-
-# Simulate different locale scenarios
-test_results = []
-
-# Test 1: Standard locale
-os.environ['LC_ALL'] = 'C'
-try:
-    import matplotlib
-    print("Test 1 PASSED: Standard locale handled")
-    test_results.append(True)
-except Exception as e:
-    print("Test 1 FAILED: {}".format(e))
-    test_results.append(False)
-
-# Test 2: Font configuration doesn't crash
-try:
-    import matplotlib.font_manager as fm
-    available_fonts = set(f.name for f in fm.fontManager.ttflist)
-    print("Test 2 PASSED: Font manager accessible ({} fonts found)".format(len(available_fonts)))
-    test_results.append(True)
-except Exception as e:
-    print("Test 2 FAILED: {}".format(e))
-    test_results.append(False)
-
-# Test 3: Matplotlib configuration works
-try:
-    matplotlib.rcParams['font.sans-serif'] = ['SimHei', 'Arial', 'sans-serif']
-    matplotlib.rcParams['axes.unicode_minus'] = False
-    print("Test 3 PASSED: Matplotlib font configuration successful")
-    test_results.append(True)
-except Exception as e:
-    print("Test 3 FAILED: {}".format(e))
-    test_results.append(False)
-
-# Summary
-passed = sum(test_results)
-total = len(test_results)
-print("Integration tests: {}/{} passed".format(passed, total))
-sys.exit(0 if passed == total else 1)
-"""
+    # Simulate different locale scenarios
+    test_results = []
+    original_lc_all = os.environ.get('LC_ALL')
     
+    # Test 1: Standard locale
+    os.environ['LC_ALL'] = 'C'
     try:
-        result = subprocess.run(
-            [sys.executable, '-c', test_code],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        print(result.stdout)
-        if result.stderr:
-            print("Warnings:", result.stderr[:200])
-        
-        return result.returncode == 0
+        import matplotlib
+        print("Test 1 PASSED: Standard locale handled")
+        test_results.append(True)
     except Exception as e:
-        print(f"✗ Integration test failed: {e}")
-        return False
+        print(f"Test 1 FAILED: {e}")
+        test_results.append(False)
+    finally:
+        # Restore locale of this process
+        if original_lc_all is None:
+            os.environ.pop('LC_ALL', None)
+        else:
+            os.environ['LC_ALL'] = original_lc_all
+    
+    # Test 2: Font configuration doesn't crash
+    try:
+        import matplotlib.font_manager as fm
+        available_fonts = set(f.name for f in fm.fontManager.ttflist)
+        print(f"Test 2 PASSED: Font manager accessible ({len(available_fonts)} fonts found)")
+        test_results.append(True)
+    except Exception as e:
+        print(f"Test 2 FAILED: {e}")
+        test_results.append(False)
+    
+    # Test 3: Matplotlib configuration works (restored afterwards)
+    try:
+        with matplotlib.rc_context():
+            matplotlib.rcParams['font.sans-serif'] = ['SimHei', 'Arial', 'sans-serif']
+            matplotlib.rcParams['axes.unicode_minus'] = False
+        print("Test 3 PASSED: Matplotlib font configuration successful")
+        test_results.append(True)
+    except Exception as e:
+        print(f"Test 3 FAILED: {e}")
+        test_results.append(False)
+    
+    # Summary
+    passed = sum(test_results)
+    total = len(test_results)
+    print(f"Integration tests: {passed}/{total} passed")
+    return passed == total
 
 def test_application_modules():
     """Test that all required modules are available"""
@@ -113,19 +100,18 @@ def test_application_modules():
     
     print("\nRequired modules:")
     for module in required_modules:
-        try:
-            __import__(module)
+        # Locate the module without executing it
+        if find_spec(module) is not None:
             print(f"  ✓ {module}")
-        except ImportError:
+        else:
             print(f"  ✗ {module} - MISSING (REQUIRED)")
             all_good = False
     
     print("\nOptional modules (with fallback):")
     for module in optional_modules:
-        try:
-            __import__(module)
+        if find_spec(module) is not None:
             print(f"  ✓ {module}")
-        except ImportError:
+        else:
             print(f"  ⚠ {module} - Not available (will use fallback)")
     
     return all_good
@@ -2,56 +2,82 @@
 Test script to verify ESAI application works with different locale settings.
 This simulates the environment issues mentioned by the reviewer.
 """
-import os
 import sys
 import subprocess
 
-def test_with_locale(locale_setting):
-    """Test application with specific locale setting"""
-    print(f"\n{'='*60}")
-    print(f"Testing with locale: {locale_setting}")
-    print('='*60)
-    
-    env = os.environ.copy()
+# Child script that imports the application once per locale setting and
+# reports one "<locale>\t<OK|error>" line for each
+_BATCH_CODE = """
+import importlib
+import os
+import sys
+
+for locale_setting in sys.argv[1:]:
     if locale_setting == "none":
         # Simulate environment without locale
-        env.pop('LC_ALL', None)
-        env.pop('LANG', None)
-        env.pop('LC_CTYPE', None)
+        for key in ('LC_ALL', 'LANG', 'LC_CTYPE'):
+            os.environ.pop(key, None)
     else:
-        env['LC_ALL'] = locale_setting
-        env['LANG'] = locale_setting
+        os.environ['LC_ALL'] = locale_setting
+        os.environ['LANG'] = locale_setting
+    
+    try:
+        if 'esai.main' in sys.modules:
+            importlib.reload(sys.modules['esai.config'])
+            importlib.reload(sys.modules['esai.main'])
+        else:
+            importlib.import_module('esai.main')
+        from esai.main import main
+        print(f"{locale_setting}\\tOK", flush=True)
+    except Exception as e:
+        print(f"{locale_setting}\\t{type(e).__name__}: {e}", flush=True)
+"""
+
+def test_with_locales(locale_settings):
+    """
+    Test application with several locale settings in a single interpreter.
+    
+    Returns:
+        Dictionary mapping each locale setting to whether the import succeeded
+    """
+    print(f"\n{'='*60}")
+    print(f"Testing with locales: {', '.join(locale_settings)}")
+    print('='*60)
+    
+    results = {locale_setting: False for locale_setting in locale_settings}
     
     try:
         # Try to import and check if it crashes
         result = subprocess.run(
-            [sys.executable, '-c', 
-             'from esai.main import main; print("SUCCESS: Application imports without crashing")'],
-            env=env,
+            [sys.executable, '-c', _BATCH_CODE, *locale_settings],
             capture_output=True,
             text=True,
-            timeout=5
+            timeout=5 * len(locale_settings)
         )
-        
-        if result.returncode == 0:
-            print(f"✓ PASSED: Application works with {locale_setting}")
-            if result.stdout:
-                print(f"  Output: {result.stdout.strip()}")
-            if result.stderr:
-                print(f"  Warnings: {result.stderr.strip()}")
-        else:
-            print(f"✗ FAILED: Application crashed with {locale_setting}")
-            print(f"  Error: {result.stderr}")
-            return False
-            
     except subprocess.TimeoutExpired:
-        print(f"✗ TIMEOUT: Application did not respond with {locale_setting}")
-        return False
+        print("✗ TIMEOUT: Application did not respond")
+        return results
     except Exception as e:
         print(f"✗ EXCEPTION: {e}")
-        return False
+        return results
+    
+    for line in result.stdout.splitlines():
+        locale_setting, _, status = line.partition('\t')
+        if locale_setting not in results:
+            continue
+        if status == 'OK':
+            print(f"✓ PASSED: Application works with {locale_setting}")
+            results[locale_setting] = True
+        else:
+            print(f"✗ FAILED: Application crashed with {locale_setting}")
+            print(f"  Error: {status}")
+    
+    if result.stderr:
+        print(f"  Warnings: {result.stderr.strip()}")
+    if result.returncode != 0:
+        print(f"✗ FAILED: Test interpreter exited with code {result.returncode}")
     
-    return True
+    return results
 
 def main():
     print("ESAI Locale Compatibility Test")
@@ -67,11 +93,9 @@ def main():
         ("en_US.UTF-8", "Common UTF-8 locale"),
     ]
     
-    results = []
-    for locale_val, description in test_cases:
-        print(f"\nTest: {description}")
-        passed = test_with_locale(locale_val)
-        results.append((description, passed))
+    passed_by_locale = test_with_locales([locale_val for locale_val, _ in test_cases])
+    results = [(description, passed_by_locale[locale_val])
+               for locale_val, description in test_cases]
     
     # Summary
     print("\n" + "="*60)
@@ -2,106 +2,187 @@
 Test script to verify resource path handling works from different working directories.
 This addresses the reviewer's concern about hardcoded relative file paths.
 """
+import ast
+import functools
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tempfile
 
-def test_resource_path_function():
-    """Test the get_resource_path function works correctly"""
-    print("="*70)
-    print("TEST 1: Resource Path Function")
-    print("="*70)
-    
-    test_code = """
-import sys
-from pathlib import Path
-
-# Add the ESAI directory to the path
-esai_dir = Path(__file__).parent.resolve()
-sys.path.insert(0, str(esai_dir))
+# Repository root, resolved from this file's location
+REPO_ROOT = Path(__file__).resolve().parent
 
-# Import the function (we'll test it without running the GUI)
+# Script run from each test directory to check resource files next to ESAI.py;
+# formatted once since it only depends on the repository root
+_CWD_TEST_CODE = """
+import sys
 import os
-from pathlib import Path
+import stat
 
-def get_resource_path(relative_path):
+def is_file(path):
+    # One stat call answers both existence and file type
     try:
-        if getattr(sys, 'frozen', False):
-            base_path = Path(sys.executable).parent
-        else:
-            base_path = Path(__file__).parent.resolve()
-        
-        resource_path = base_path / relative_path
-        
-        if not resource_path.exists():
-            raise FileNotFoundError(f"Resource file not found: {resource_path}")
-        
-        return str(resource_path)
-    except Exception as e:
-        print(f"Error: {e}")
-        raise
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
 
-# Test with existing files
-try:
-    logo_path = get_resource_path("logo.ico")
-    print(f"Found logo.ico at: {logo_path}")
-    assert os.path.exists(logo_path), "Logo file doesn't exist"
-    print("Test 1.1 PASSED: logo.ico located successfully")
-except Exception as e:
-    print(f"Test 1.1 FAILED: {e}")
-    sys.exit(1)
+# Get the ESAI directory (plain strings; no Path objects are needed)
+esai_dir = r'{esai_path}'
+esai_file = os.path.join(esai_dir, 'ESAI.py')
+print(f"Testing from CWD: {{os.getcwd()}}")
+print(f"ESAI.py location: {{esai_file}}")
 
+# ESAI.py is checked for get_resource_path by the parent process (argv[1])
 try:
-    splash_path = get_resource_path("rj.png")
-    print(f"Found rj.png at: {splash_path}")
-    assert os.path.exists(splash_path), "Splash file doesn't exist"
-    print("Test 1.2 PASSED: rj.png located successfully")
+    if sys.argv[1] == 'True':
+        print("get_resource_path function found in ESAI.py")
+    else:
+        print("WARNING: get_resource_path function not found")
+        sys.exit(1)
+    
+    # Check that resource files exist relative to ESAI.py
+    logo_path = os.path.join(esai_dir, 'logo.ico')
+    splash_path = os.path.join(esai_dir, 'rj.png')
+    
+    if is_file(logo_path):
+        print(f"logo.ico exists at: {{logo_path}}")
+    else:
+        print(f"ERROR: logo.ico not found at: {{logo_path}}")
+        sys.exit(1)
+    
+    if is_file(splash_path):
+        print(f"rj.png exists at: {{splash_path}}")
+    else:
+        print(f"ERROR: rj.png not found at: {{splash_path}}")
+        sys.exit(1)
+    
+    print("All resource files accessible!")
+    
 except Exception as e:
-    print(f"Test 1.2 FAILED: {e}")
+    print(f"Error: {{e}}")
     sys.exit(1)
+""".format(esai_path=str(REPO_ROOT))
 
-# Test with non-existent file (should raise clear error)
-try:
-    nonexistent = get_resource_path("nonexistent.png")
-    print("Test 1.3 FAILED: Should have raised FileNotFoundError")
-    sys.exit(1)
-except FileNotFoundError as e:
-    print("Test 1.3 PASSED: Correct error handling for missing files")
-except Exception as e:
-    print(f"Test 1.3 FAILED: Wrong exception type: {e}")
-    sys.exit(1)
+# Key components of the resource path handling in ESAI.py
+_ESAI_CHECKS = (
+    "get_resource_path function",
+    "Path import",
+    "Resource path usage for logo",
+    "Resource path usage for splash",
+    "Error handling for logo",
+)
 
-print("\\nAll resource path tests passed!")
-"""
+def _called_name(call):
+    """Name of the called function, for plain and attribute calls (e.g. self.f())"""
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _validate_esai(repo_root):
+    """
+    Validate ESAI.py in repo_root, reading and parsing the file only once.
+    
+    Returns a dict mapping each name in _ESAI_CHECKS to whether the component
+    was found, plus "resource_fn" (get_resource_path is defined) and
+    "compile_error" (None if the file compiles). Raises OSError if ESAI.py
+    cannot be read. Results are cached, so all tests share a single validation.
+    """
+    esai_file = repo_root / 'ESAI.py'
+    code = esai_file.read_bytes()
     
-    # Save test to temporary file
-    test_file = Path("d:/Projects/ESAI-master") / "temp_test.py"
+    # A single parse provides the components and the tree to compile
     try:
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write(test_code)
-        
-        result = subprocess.run(
-            [sys.executable, str(test_file)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd="d:/Projects/ESAI-master"
-        )
-        
-        print(result.stdout)
-        if result.stderr:
-            print("Warnings:", result.stderr[:300])
-        
-        return result.returncode == 0
+        tree = ast.parse(code, filename=str(esai_file))
+    except SyntaxError as e:
+        # Without a tree, fall back to a plain search for the function
+        results = dict.fromkeys(_ESAI_CHECKS, False)
+        results.update(resource_fn=b'def get_resource_path' in code, compile_error=str(e))
+        return results
+    
+    # Compiling the tree catches errors the parser accepts (e.g. module-level return)
+    try:
+        compile(tree, str(esai_file), 'exec')
+        compile_error = None
+    except SyntaxError as e:
+        compile_error = str(e)
+    
+    functions = set()       # (name, argument names)
+    imports = set()         # (module, imported name)
+    resource_args = set()   # string arguments of get_resource_path calls
+    handlers = set()        # (exception name, bound name)
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.add((node.name, tuple(arg.arg for arg in node.args.args)))
+        elif isinstance(node, ast.ImportFrom):
+            imports.update((node.module, alias.name) for alias in node.names)
+        elif isinstance(node, ast.Call) and _called_name(node) == 'get_resource_path':
+            resource_args.update(arg.value for arg in node.args if isinstance(arg, ast.Constant))
+        elif isinstance(node, ast.ExceptHandler) and isinstance(node.type, ast.Name):
+            handlers.add((node.type.id, node.name))
+    
+    return {
+        "get_resource_path function": ('get_resource_path', ('relative_path',)) in functions,
+        "Path import": ('pathlib', 'Path') in imports,
+        "Resource path usage for logo": 'logo.ico' in resource_args,
+        "Resource path usage for splash": 'rj.png' in resource_args,
+        "Error handling for logo": ('FileNotFoundError', 'e') in handlers,
+        'resource_fn': any(name == 'get_resource_path' for name, _ in functions),
+        'compile_error': compile_error,
+    }
+
+def _check_resource_paths():
+    """Check resource lookup for existing and missing files; returns True if all pass"""
+    from esai.config import get_resource_path
+    
+    # Test with existing files
+    try:
+        logo_path = get_resource_path("logo.ico")
+        print(f"Found logo.ico at: {logo_path}")
+        assert os.path.exists(logo_path), "Logo file doesn't exist"
+        print("Test 1.1 PASSED: logo.ico located successfully")
+    except Exception as e:
+        print(f"Test 1.1 FAILED: {e}")
+        return False
+    
+    try:
+        splash_path = get_resource_path("rj.png")
+        print(f"Found rj.png at: {splash_path}")
+        assert os.path.exists(splash_path), "Splash file doesn't exist"
+        print("Test 1.2 PASSED: rj.png located successfully")
+    except Exception as e:
+        print(f"Test 1.2 FAILED: {e}")
+        return False
+    
+    # Test with non-existent file (should raise clear error)
+    try:
+        get_resource_path("nonexistent.png")
+        print("Test 1.3 FAILED: Should have raised FileNotFoundError")
+        return False
+    except FileNotFoundError:
+        print("Test 1.3 PASSED: Correct error handling for missing files")
+    except Exception as e:
+        print(f"Test 1.3 FAILED: Wrong exception type: {e}")
+        return False
+    
+    print("\nAll resource path tests passed!")
+    return True
+
+def test_resource_path_function():
+    """Test the get_resource_path function works correctly"""
+    print("="*70)
+    print("TEST 1: Resource Path Function")
+    print("="*70)
+    
+    try:
+        return _check_resource_paths()
     except Exception as e:
         print(f"Test failed: {e}")
         return False
-    finally:
-        # Cleanup
-        if test_file.exists():
-            test_file.unlink()
 
 def test_different_working_directories():
     """Test that resources can be found from different working directories"""
@@ -109,7 +190,7 @@ def test_different_working_directories():
     print("TEST 2: Different Working Directories")
     print("="*70)
     
-    esai_dir = Path("d:/Projects/ESAI-master").resolve()
+    esai_dir = REPO_ROOT
     
     # Test directories to run from
     test_dirs = [
@@ -118,74 +199,46 @@ def test_different_working_directories():
         Path(tempfile.gettempdir()),  # Temp directory (edge case)
     ]
     
-    test_code = """
-import sys
-import os
-from pathlib import Path
-
-# Get the ESAI directory
-esai_file = Path(r'{esai_path}') / 'ESAI.py'
-print(f"Testing from CWD: {{os.getcwd()}}")
-print(f"ESAI.py location: {{esai_file}}")
-
-# Read the ESAI.py file to check for get_resource_path
-try:
-    with open(esai_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-        if 'def get_resource_path' in content:
-            print("get_resource_path function found in ESAI.py")
-        else:
-            print("WARNING: get_resource_path function not found")
-            sys.exit(1)
-    
-    # Check that resource files exist relative to ESAI.py
-    logo_path = esai_file.parent / 'logo.ico'
-    splash_path = esai_file.parent / 'rj.png'
-    
-    if logo_path.exists():
-        print(f"logo.ico exists at: {{logo_path}}")
-    else:
-        print(f"ERROR: logo.ico not found at: {{logo_path}}")
-        sys.exit(1)
-    
-    if splash_path.exists():
-        print(f"rj.png exists at: {{splash_path}}")
-    else:
-        print(f"ERROR: rj.png not found at: {{splash_path}}")
-        sys.exit(1)
-    
-    print("All resource files accessible!")
-    
-except Exception as e:
-    print(f"Error: {{e}}")
-    sys.exit(1)
-"""
+    try:
+        has_resource_fn = _validate_esai(REPO_ROOT)['resource_fn']
+    except OSError as e:
+        print(f"Error: {e}")
+        return False
     
-    all_passed = True
-    for i, test_dir in enumerate(test_dirs, 1):
-        print(f"\nTest 2.{i}: Running from {test_dir}")
-        
+    def run_from(test_dir):
+        """Run the check from test_dir, returning the result or the raised exception"""
         try:
-            result = subprocess.run(
-                [sys.executable, '-c', test_code.format(esai_path=str(esai_dir))],
+            return subprocess.run(
+                [sys.executable, '-c', _CWD_TEST_CODE, str(has_resource_fn)],
                 capture_output=True,
-                text=True,
-                timeout=10,
+                timeout=5,
                 cwd=str(test_dir)
             )
-            
-            print(result.stdout)
-            
-            if result.returncode == 0:
-                print(f"Test 2.{i} PASSED")
-            else:
-                print(f"Test 2.{i} FAILED")
-                if result.stderr:
-                    print("Error:", result.stderr[:200])
-                all_passed = False
-                
         except Exception as e:
-            print(f"Test 2.{i} FAILED: {e}")
+            return e
+    
+    # Start all subprocesses together; results are reported in order
+    with ThreadPoolExecutor(max_workers=len(test_dirs)) as executor:
+        results = list(executor.map(run_from, test_dirs))
+    
+    all_passed = True
+    for i, (test_dir, result) in enumerate(zip(test_dirs, results), 1):
+        print(f"\nTest 2.{i}: Running from {test_dir}")
+        
+        if isinstance(result, Exception):
+            print(f"Test 2.{i} FAILED: {result}")
+            all_passed = False
+            continue
+        
+        # Output is captured as bytes and only decoded for display
+        print(result.stdout.decode('utf-8', errors='replace'))
+        
+        if result.returncode == 0:
+            print(f"Test 2.{i} PASSED")
+        else:
+            print(f"Test 2.{i} FAILED")
+            if result.stderr:
+                print("Error:", result.stderr[:200].decode('utf-8', errors='replace'))
             all_passed = False
     
     return all_passed
@@ -196,62 +249,57 @@ def test_import_without_crash():
     print("TEST 3: ESAI.py Syntax and Import")
     print("="*70)
     
-    esai_file = Path("d:/Projects/ESAI-master/ESAI.py")
-    
     try:
-        with open(esai_file, 'r', encoding='utf-8') as f:
-            code = f.read()
-        
-        # Check for key components
-        checks = [
-            ("get_resource_path function", "def get_resource_path(relative_path):"),
-            ("Path import", "from pathlib import Path"),
-            ("Resource path usage for logo", 'get_resource_path("logo.ico")'),
-            ("Resource path usage for splash", 'get_resource_path("rj.png")'),
-            ("Error handling for logo", "except FileNotFoundError as e:"),
-        ]
-        
-        all_found = True
-        for name, pattern in checks:
-            if pattern in code:
-                print(f"✓ {name}: Found")
-            else:
-                print(f"✗ {name}: Not found")
-                all_found = False
-        
-        if all_found:
-            print("\nAll required components present")
-        else:
-            print("\nSome components missing")
-            return False
-        
-        # Try to compile
-        compile(code, str(esai_file), 'exec')
-        print("✓ ESAI.py compiles without syntax errors")
-        
-        return True
-        
-    except Exception as e:
+        results = _validate_esai(REPO_ROOT)
+    except OSError as e:
         print(f"✗ Error: {e}")
         return False
+    
+    if results['compile_error'] is not None:
+        print(f"✗ Error: {results['compile_error']}")
+        return False
+    print("✓ ESAI.py compiles without syntax errors")
+    
+    # Check for key components
+    all_found = True
+    for name in _ESAI_CHECKS:
+        if results[name]:
+            print(f"✓ {name}: Found")
+        else:
+            print(f"✗ {name}: Not found")
+            all_found = False
+    
+    if all_found:
+        print("\nAll required components present")
+    else:
+        print("\nSome components missing")
+        return False
+    
+    return True
 
-def main():
+def main(fast_fail=False):
+    """Run all tests; with fast_fail, stop at the first failing test"""
     print("\n" + "="*70)
     print("ESAI RESOURCE PATH HANDLING TEST SUITE")
     print("="*70)
     print("Testing fix for hardcoded relative file paths (Reviewer Comment 3)")
     print("="*70 + "\n")
     
-    results = []
-    
-    # Test 1: Resource path function
-    results.append(("Resource Path Function", test_resource_path_function()))
-    
-    # Test 2: Different working directories
-    results.append(("Different Working Directories", test_different_working_directories()))
+    tests = [
+        # Test 1: Resource path function
+        ("Resource Path Function", test_resource_path_function),
+        # Test 2: Different working directories
+        ("Different Working Directories", test_different_working_directories),
+        # Test 3: Import and syntax
+        ("ESAI.py Syntax Check", test_import_without_crash),
+    ]
     
-    # Test 3: Import and syntax
-    results.append(("ESAI.py Syntax Check", test_import_without_crash()))
+    results = []
+    for test_name, test_fn in tests:
+        passed = test_fn()
+        results.append((test_name, passed))
+        if not passed and fast_fail:
+            break
     
     # Summary
     print("\n" + "="*70)
@@ -262,8 +310,11 @@ def main():
         status = "✓ PASSED" if passed else "✗ FAILED"
         print(f"{status}: {test_name}")
     
+    for test_name, _ in tests[len(results):]:
+        print(f"- SKIPPED: {test_name}")
+    
     passed_count = sum(1 for _, passed in results if passed)
-    total_count = len(results)
+    total_count = len(tests)
     print(f"\nTotal: {passed_count}/{total_count} tests passed")
     
     if passed_count == total_count:
@@ -282,5 +333,5 @@ def main():
     return passed_count == total_count
 
 if __name__ == "__main__":
-    success = main()
+    success = main(fast_fail='--fast-fail' in sys.argv[1:])
     sys.exit(0 if success else 1)
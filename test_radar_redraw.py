@@ -0,0 +1,164 @@
+"""
+Test script to verify radar chart redraw throttling.
+Rapid score changes should be coalesced instead of redrawing the chart each time.
+"""
+import sys
+import os
+
+# Add project path
+project_dir = os.path.dirname(os.path.abspath(__file__))
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+import matplotlib
+matplotlib.use('Agg')  # Use non-GUI backend for testing
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from esai.config import ColorConfig
+from esai.visualization import RadarChart, RadarChartSimple, _get_colormap
+
+
+class _RecordingChart(RadarChartSimple):
+    """RadarChartSimple that records the total score of each draw"""
+    
+    def __init__(self, ax, colormap, disp_skip=0):
+        super().__init__(ax, colormap, disp_skip)
+        self.drawn = []
+    
+    def draw(self, principle_colors, total_score, dimension_scores=None):
+        self.drawn.append(total_score)
+        super().draw(principle_colors, total_score, dimension_scores)
+
+
+class _FakeTkWidget:
+    """Stand-in for a Tk widget that records scheduled callbacks"""
+    
+    def __init__(self):
+        self.scheduled = []
+    
+    def after(self, delay_ms, callback):
+        self.scheduled.append((delay_ms, callback))
+
+
+def _make_chart(disp_skip=0):
+    """Create a recording chart on a fresh Agg figure"""
+    fig = Figure(figsize=(4, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    colormap, _ = _get_colormap(tuple(ColorConfig().color_dict.items()))
+    return _RecordingChart(ax, colormap, disp_skip)
+
+
+def test_skip_requests_without_tk():
+    """Test that every (disp_skip + 1)-th request is drawn, starting with the first"""
+    print("Test 1: Skip draw requests outside Tk")
+    
+    chart = _make_chart(disp_skip=2)
+    for score in range(1, 8):
+        chart.request_draw({1: 0.5}, float(score))
+    
+    assert chart.drawn == [1.0, 4.0, 7.0], f"Unexpected draws: {chart.drawn}"
+    print(f"✓ Requests drawn: {chart.drawn}")
+    
+    # A skipped state is rendered by flush()
+    chart.request_draw({1: 0.5}, 8.0)
+    chart.flush()
+    assert chart.drawn[-1] == 8.0, "flush() should draw the latest skipped state"
+    print("✓ flush() draws the latest skipped state")
+    
+    # Nothing is pending anymore
+    chart.flush()
+    assert len(chart.drawn) == 4, "flush() without a pending state should not draw"
+    print("✓ flush() without a pending state does nothing")
+    
+    return True
+
+
+def test_coalesce_requests_on_tk():
+    """Test that rapid requests on a Tk canvas are coalesced into one draw"""
+    print("\nTest 2: Coalesce draw requests on Tk")
+    
+    chart = _make_chart()
+    widget = _FakeTkWidget()
+    chart.ax.figure.canvas.get_tk_widget = lambda: widget
+    
+    for score in range(1, 6):
+        chart.request_draw({1: 0.5}, float(score))
+    
+    assert chart.drawn == [], "Requests on Tk should be deferred"
+    assert len(widget.scheduled) == 1, \
+        f"One redraw should be scheduled, but found {len(widget.scheduled)}"
+    assert widget.scheduled[0][0] == RadarChartSimple.REDRAW_DELAY_MS
+    print("✓ Five requests scheduled a single deferred redraw")
+    
+    # Run the scheduled callback as Tk would
+    widget.scheduled[0][1]()
+    assert chart.drawn == [5.0], f"Only the latest request should be drawn: {chart.drawn}"
+    print("✓ Deferred redraw renders only the latest request")
+    
+    # A new request after the redraw schedules another one
+    chart.request_draw({1: 0.5}, 6.0)
+    assert len(widget.scheduled) == 2, "A new request should schedule another redraw"
+    print("✓ Later requests schedule a new redraw")
+    
+    return True
+
+
+def test_radar_chart_figures():
+    """Test that create_figure returns new figures and update_scores reuses the latest one"""
+    print("\nTest 3: RadarChart figure reuse")
+    
+    dimension_scores = {'SC': 5.0, 'SP': 10.0, 'AT': 10.0, 'Economy': 2.5,
+                        'Method': 2.5, 'Operator': 5.0, 'Reagent': 5.0, 'Waste': 10.0}
+    chart = RadarChart()
+    first = chart.create_figure(dimension_scores, {1: 0.2}, 50.0)
+    FigureCanvasAgg(first)
+    first_texts = [text.get_text() for text in first.axes[0].texts]
+    
+    second = chart.create_figure(dimension_scores, {1: 0.8}, 80.0)
+    FigureCanvasAgg(second)
+    assert second is not first, "create_figure should return a new figure"
+    assert [text.get_text() for text in first.axes[0].texts] == first_texts, \
+        "Creating a new figure should not change an earlier one"
+    print("✓ create_figure returns independent figures")
+    
+    chart.update_scores(dimension_scores, {1: 0.5}, 65.0)
+    assert chart.get_figure() is second, "update_scores should keep the current figure"
+    assert '65.00' in [text.get_text() for text in second.axes[0].texts], \
+        "update_scores should update the total score text"
+    assert [text.get_text() for text in first.axes[0].texts] == first_texts, \
+        "update_scores should not change an earlier figure"
+    print("✓ update_scores updates the latest figure in place")
+    
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("=" * 70)
+    print("Radar Chart Redraw Throttling Test")
+    print("=" * 70)
+    print()
+    
+    try:
+        test_skip_requests_without_tk()
+        test_coalesce_requests_on_tk()
+        test_radar_chart_figures()
+        
+        print("\n" + "=" * 70)
+        print("✅ All tests passed!")
+        print("=" * 70)
+        return True
+        
+    except AssertionError as e:
+        print("\n" + "=" * 70)
+        print("❌ Test failed")
+        print("=" * 70)
+        print(f"Error: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)